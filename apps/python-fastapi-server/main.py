@@ -26,6 +26,9 @@ load_dotenv()
 # Global storage instance
 storage: Optional[ZenStorage] = None
 
+# Global HTTP client for downloading URL sources
+http_client: Optional[httpx.AsyncClient] = None
+
 
 # Global event listener for upload tracking
 class UploadEventListener(ZenUploadListener):
@@ -74,13 +77,19 @@ class UploadEventListener(ZenUploadListener):
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI."""
     # Startup
-    global storage
+    global storage, http_client
     print("🚀 FileZen Python FastAPI Server starting...")
     print(f"📁 API Documentation: http://localhost:8000/docs")
     print(f"🌐 Interactive Interface: http://localhost:8000")
 
+    # One connection pool shared by the SDK and origin downloads
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    http_client = httpx.AsyncClient(transport=transport)
+
     # Initialize storage with event listener
-    storage = ZenStorage()
+    storage = ZenStorage(transport=transport)
 
     # Add event listener
     storage.add_listener(UploadEventListener())
@@ -90,6 +99,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if storage:
         await storage.close()
+    if http_client:
+        await http_client.aclose()
     print("👋 FileZen Python FastAPI Server shutting down...")
 
 
@@ -347,21 +358,21 @@ async def upload_from_url(request: UrlUploadRequest):
 
     try:
         # Download the URL content first, then upload as bytes to avoid streaming issues
-        async with httpx.AsyncClient() as client:
-            response = await client.get(request.url)
-            response.raise_for_status()
-            content = response.content
-
-            # Determine MIME type from response headers
-            content_type = response.headers.get("content-type", "application/octet-stream")
-
-            # Upload the downloaded content
-            upload = await storage.upload(
-                content,
-                name=request.name or "url_download",
-                mime_type=content_type,
-                metadata=request.metadata or {"source": "url", "original_url": request.url}
-            )
+        # Reuse the shared client so downloads keep warm connections
+        response = await http_client.get(request.url)
+        response.raise_for_status()
+        content = response.content
+
+        # Determine MIME type from response headers
+        content_type = response.headers.get("content-type", "application/octet-stream")
+
+        # Upload the downloaded content
+        upload = await storage.upload(
+            content,
+            name=request.name or "url_download",
+            mime_type=content_type,
+            metadata=request.metadata or {"source": "url", "original_url": request.url}
+        )
 
         return upload.file
 
@@ -625,8 +636,8 @@ async def get_status():
     """Get upload status."""
     return {
         "uploads": UploadEventListener().uploads,
-        "active_count": len(storage.active_uploads) if storage else 0,
-        "total_count": len(storage.get_uploads) if storage else 0
+        "active_count": storage.uploads.count("active") if storage else 0,
+        "total_count": len(storage.uploads) if storage else 0
     }
 
 
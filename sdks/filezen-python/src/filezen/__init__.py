@@ -11,32 +11,49 @@ from .types import (
     StartMultipartUploadParams,
     UploadMode,
     ZenApiResponse,
+    ZenBase64Source,
+    ZenBuffer,
+    ZenBytesSource,
     ZenFile,
     ZenList,
     ZenMetadata,
     ZenMultipartChunkResponse,
     ZenMultipartInitResponse,
+    ZenPathSource,
+    ZenProgress,
     ZenProject,
     ZenStorageBulkItem,
     ZenStorageUploadOptions,
+    ZenStreamSource,
+    ZenTextSource,
     ZenUploaderParams,
     ZenUploadResponse,
     ZenUploadSource,
+    ZenUrlSource,
     to_dataclass,
 )
 from .zen_api import ZenApi
+from .zen_checkpoint import ZenUploadCheckpoint
+from .zen_chunk_sizer import ZenChunkSizer
+from .zen_dedup import ZenDedupIndex, ZenMemoryDedupIndex, ZenSQLiteDedupIndex
 from .zen_error import ZenError
+from .zen_journal import ZenJournalEntry, ZenUploadJournal
+from .zen_queue import ZenUploadPriority
+from .zen_registry import ZenUploadRegistry
+from .zen_retry import ZenRetryPolicy
 from .zen_storage import (
+    ZenBulkUploadSummary,
     ZenMultipartControl,
-    ZenProgress,
     ZenStorage,
     ZenUploadListener,
 )
+from .zen_sync_storage import ZenSyncMultipartControl, ZenSyncStorage
 from .zen_upload import ZenUpload
 
 __version__ = "0.1.0"
 __all__ = [
     "ZenStorage",
+    "ZenSyncStorage",
     "ZenUpload",
     "ZenApi",
     "ZenFile",
@@ -44,13 +61,32 @@ __all__ = [
     "ZenList",
     "ZenError",
     "ZenUploadSource",
+    "ZenUrlSource",
+    "ZenBase64Source",
+    "ZenTextSource",
+    "ZenBytesSource",
+    "ZenPathSource",
+    "ZenStreamSource",
+    "ZenBuffer",
     "ZenMetadata",
     "ZenUploaderParams",
     "ZenUploadListener",
     "ZenProgress",
     "ZenStorageUploadOptions",
     "ZenStorageBulkItem",
+    "ZenBulkUploadSummary",
     "ZenMultipartControl",
+    "ZenSyncMultipartControl",
+    "ZenUploadJournal",
+    "ZenJournalEntry",
+    "ZenUploadCheckpoint",
+    "ZenChunkSizer",
+    "ZenRetryPolicy",
+    "ZenUploadPriority",
+    "ZenUploadRegistry",
+    "ZenDedupIndex",
+    "ZenMemoryDedupIndex",
+    "ZenSQLiteDedupIndex",
     "UploadMode",
     "StartMultipartUploadParams",
     "MultipartUploadChunkParams",
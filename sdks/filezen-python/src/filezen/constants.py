@@ -4,3 +4,18 @@ DEFAULT_API_URL = "https://api.filezen.dev"
 DEFAULT_SIGN_URL = "/files/upload"
 MULTIPART_THRESHOLD = 10 * 1024 * 1024  # 10MB threshold for multipart upload
 MULTIPART_CHUNK_SIZE = 10 * 1024 * 1024  # 10MB chunks
+MULTIPART_CONCURRENCY = 1  # Chunks in flight per multipart upload
+STREAM_PIECE_SIZE = 64 * 1024  # Request bodies are handed to httpx in 64KB pieces
+MULTIPART_MIN_CHUNK_SIZE = 1 * 1024 * 1024  # Adaptive chunk sizing lower bound
+MULTIPART_MAX_CHUNK_SIZE = 100 * 1024 * 1024  # Adaptive chunk sizing upper bound
+MULTIPART_TARGET_CHUNK_SECONDS = 5.0  # Adaptive chunks aim to take this long to send
+BULK_UPLOAD_CONCURRENCY = 16  # Uploads running at once in a bulk upload
+PROGRESS_INTERVAL = 0.25  # Seconds between progress events for an upload
+LISTENER_QUEUE_SIZE = 1000  # Events waiting for background listener delivery
+CHUNK_CHECKSUM_ATTEMPTS = 3  # Sends of a chunk whose checksum the server disputes
+COMPRESSION_MIN_SIZE = 1024  # Smaller content is not worth compressing
+COMPRESSION_MIN_RATIO = 0.9  # Compress only if a sample shrinks to this fraction
+COMPRESSION_SAMPLE_SIZE = 64 * 1024  # Bytes sampled to judge compressibility
+COMPRESSION_BLOCK_SIZE = 1024 * 1024  # Files are compressed in 1MB blocks
+FILES_PAGE_SIZE = 100  # Files requested per page when iterating all files
+FILES_PREFETCH = 4  # Pages requested ahead of the caller when iterating files
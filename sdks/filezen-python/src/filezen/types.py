@@ -1,8 +1,9 @@
 """Type definitions for the FileZen Python SDK."""
 
+import os
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterable, BinaryIO, Dict, Iterable, List, Optional, Union
 
 
 # File types
@@ -21,7 +22,72 @@ class FileState(str, Enum):
 ZenMetadata = Dict[str, Any]
 
 # Upload types
-ZenUploadSource = Union[bytes, str]
+# Any buffer-protocol object (bytes, bytearray, memoryview, mmap, NumPy arrays...)
+# is accepted at runtime; these are the types that can be spelled statically.
+ZenBuffer = Union[bytes, bytearray, memoryview]
+
+
+@dataclass
+class ZenUrlSource:
+    """Upload the content served at a URL."""
+
+    url: str
+
+
+@dataclass
+class ZenBase64Source:
+    """Upload base64 data or a base64 data URL, decoded."""
+
+    data: str
+
+
+@dataclass
+class ZenTextSource:
+    """Upload a string as UTF-8 text, even if it looks like a URL or base64."""
+
+    text: str
+
+
+@dataclass
+class ZenBytesSource:
+    """Upload a bytes-like buffer."""
+
+    data: ZenBuffer
+
+
+@dataclass
+class ZenPathSource:
+    """Upload a file on disk, read lazily. Unlike a plain str, a str path is a path."""
+
+    path: Union[str, "os.PathLike[str]"]
+
+
+@dataclass
+class ZenStreamSource:
+    """Upload an iterable of byte pieces as a stream of unknown size."""
+
+    stream: Union[AsyncIterable[ZenBuffer], Iterable[ZenBuffer]]
+
+
+# Paths and binary file objects are read lazily; a plain str is never a path.
+# Iterables of byte pieces are uploaded as a stream of unknown size. A plain str
+# is sniffed as a URL, base64 or text; the typed sources skip the guess.
+ZenUploadSource = Union[
+    bytes,
+    bytearray,
+    memoryview,
+    str,
+    "os.PathLike[str]",
+    BinaryIO,
+    AsyncIterable[ZenBuffer],
+    Iterable[ZenBuffer],
+    ZenUrlSource,
+    ZenBase64Source,
+    ZenTextSource,
+    ZenBytesSource,
+    ZenPathSource,
+    ZenStreamSource,
+]
 
 
 @dataclass
@@ -62,6 +128,8 @@ class ZenStorageUploadOptions:
     project_id: Optional[str] = None
     mime_type: Optional[str] = None
     metadata: Optional[ZenMetadata] = None
+    multipart_concurrency: Optional[int] = None
+    resume: bool = False
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ZenStorageUploadOptions":
@@ -75,17 +143,30 @@ class ZenStorageUploadOptions:
                 converted_data["folder_id"] = value
             elif key == "projectId":
                 converted_data["project_id"] = value
+            elif key == "multipartConcurrency":
+                converted_data["multipart_concurrency"] = value
             else:
                 converted_data[key] = value
         return cls(**converted_data)
 
 
+@dataclass
+class ZenProgress:
+    """Progress information for uploads."""
+
+    bytes: Optional[int] = None
+    total: Optional[int] = None
+    percent: Optional[float] = None
+
+
 @dataclass
 class ZenStorageBulkItem:
     """Bulk upload item."""
 
     source: ZenUploadSource
     options: Optional[ZenStorageUploadOptions] = None
+    # Identifies the item in an upload_stream checkpoint; compared as a string
+    key: Optional[Union[str, int]] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ZenStorageBulkItem":
@@ -96,7 +177,7 @@ class ZenStorageBulkItem:
                 options = ZenStorageUploadOptions.from_dict(data["options"])
             else:
                 options = data["options"]
-        return cls(source=data["source"], options=options)
+        return cls(source=data["source"], options=options, key=data.get("key"))
 
 
 # Multipart types
@@ -141,7 +222,7 @@ class MultipartUploadChunkParams:
     """Parameters for uploading a multipart chunk."""
 
     session_id: str
-    chunk: bytes
+    chunk: ZenBuffer
     chunk_index: Optional[int] = None
 
     @classmethod
@@ -277,6 +358,17 @@ class ZenProject:
             raw_data = ZenProjectData.from_dict(data)
             return cls.from_dict(raw_data)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the API's dictionary format."""
+        return {
+            "id": self.id,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+            "name": self.name,
+            "organisationId": self.organisation_id,
+            "region": self.region,
+        }
+
 
 @dataclass
 class ZenFile:
@@ -332,6 +424,26 @@ class ZenFile:
             metadata=raw_data.metadata,
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the API's dictionary format."""
+        return {
+            "id": self.id,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+            "type": self.type.value,
+            "state": self.state.value,
+            "name": self.name,
+            "mimeType": self.mime_type,
+            "size": self.size,
+            "region": self.region,
+            "url": self.url,
+            "projectId": self.project_id,
+            "project": self.project.to_dict() if self.project else None,
+            "parentId": self.parent_id,
+            "parent": self.parent.to_dict() if self.parent else None,
+            "metadata": self.metadata,
+        }
+
 
 @dataclass
 class ZenList:
@@ -342,6 +454,8 @@ class ZenList:
     page_count: int
     count: int
     total: int
+    # Keyset cursor for the next page, when the API pages by cursor
+    next_cursor: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ZenList":
@@ -352,6 +466,7 @@ class ZenList:
             page_count=data.get("pageCount", 0),
             count=data.get("count", 0),
             total=data.get("total", 0),
+            next_cursor=data.get("nextCursor"),
         )
 
 
@@ -408,6 +523,7 @@ class ZenMultipartChunkResponse(ZenApiResponse):
     is_complete: bool = False
     file: Optional[ZenFile] = None
     next_chunk_index: Optional[int] = None
+    checksum: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ZenMultipartChunkResponse":
@@ -416,12 +532,14 @@ class ZenMultipartChunkResponse(ZenApiResponse):
         is_complete = False
         file = None
         next_chunk_index = None
+        checksum = None
 
         if response.data and isinstance(response.data, dict):
             is_complete = response.data.get("isComplete", False)
             if "file" in response.data and response.data["file"]:
                 file = ZenFile.from_dict(response.data["file"])
             next_chunk_index = response.data.get("nextChunkIndex")
+            checksum = response.data.get("checksum")
 
         return cls(
             data=response.data,
@@ -429,6 +547,7 @@ class ZenMultipartChunkResponse(ZenApiResponse):
             is_complete=is_complete,
             file=file,
             next_chunk_index=next_chunk_index,
+            checksum=checksum,
         )
 
 
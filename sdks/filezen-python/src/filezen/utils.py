@@ -1,45 +1,64 @@
 """Utility functions for the FileZen Python SDK."""
 
-import base64
 import re
+from typing import Any
 from urllib.parse import urlparse
 
 
 def is_url(source: str) -> bool:
     """Check if source is a URL."""
     try:
-        result = urlparse(source)
+        # Scheme and host are at the start; parsing a large payload would copy it
+        result = urlparse(source[:2048])
         return all([result.scheme, result.netloc])
     except Exception:
         return False
 
 
+# Base64 alphabet, and padded base64: "=" only at the very end
+_BASE64_CHARS = re.compile(r"[A-Za-z0-9+/]*")
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+# Characters checked at each end of a string that might be base64
+_BASE64_SAMPLE_SIZE = 4096
+
+
 def is_base64(source: str) -> bool:
-    """Check if source is base64 encoded."""
+    """Check if source looks base64 encoded.
+
+    Only the length and a sample at each end are checked, so the cost is bounded
+    however large the source is. Wrap a source in ZenBase64Source or
+    ZenTextSource to skip the guess.
+    """
     # Check for data URL format
     if source.startswith("data:"):
         return True
 
-    # Check for plain base64
-    try:
-        # Base64 should only contain valid characters
-        base64_pattern = re.compile(r"^[A-Za-z0-9+/]*={0,2}$")
-        if not base64_pattern.match(source):
-            return False
-
-        # Base64 should be reasonably long (at least 16 characters for meaningful data)
-        # and typically doesn't contain common English words
-        if len(source) < 16:
-            return False
-
-        # Try to decode to verify it's valid base64
-        if len(source) % 4 == 0:  # Valid base64 length
-            base64.b64decode(source)
-            return True
-        return False
-    except Exception:
+    # Base64 should be reasonably long (at least 16 characters for meaningful data)
+    # and a whole number of 4-character groups
+    if len(source) < 16 or len(source) % 4:
         return False
 
+    # Base64 should only contain valid characters
+    if len(source) <= 2 * _BASE64_SAMPLE_SIZE:
+        return _BASE64_PATTERN.fullmatch(source) is not None
+    head = source[:_BASE64_SAMPLE_SIZE]
+    tail = source[-_BASE64_SAMPLE_SIZE:]
+    return (
+        _BASE64_CHARS.fullmatch(head) is not None
+        and _BASE64_PATTERN.fullmatch(tail) is not None
+    )
+
+
+def to_memoryview(source: Any) -> memoryview:
+    """Return a flat byte view over a buffer-protocol object without copying it."""
+    view = memoryview(source)
+    if view.format == "B" and view.ndim == 1:
+        return view
+    if not view.c_contiguous:
+        # Strided buffers (e.g. sliced NumPy arrays) have to be compacted once
+        view = memoryview(view.tobytes())
+    return view.cast("B")
+
 
 def generate_local_id() -> str:
     """Generate a unique local ID."""
@@ -1,13 +1,18 @@
 """API communication for the FileZen Python SDK."""
 
+import asyncio
+import json
 import os
-from typing import Any, Dict, Optional, Union, cast
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union, cast
+from urllib.parse import quote
 
 import httpx
 
-from .constants import DEFAULT_API_URL
+from .constants import DEFAULT_API_URL, STREAM_PIECE_SIZE
 from .types import (
     StartMultipartUploadParams,
+    ZenBuffer,
     ZenFile,
     ZenList,
     ZenMetadata,
@@ -17,20 +22,144 @@ from .types import (
     ZenUploadResponse,
     to_dataclass,
 )
+from .utils import to_memoryview
 from .zen_error import ZenError, build_zen_error
+from .zen_retry import ZenRetryPolicy
+
+
+def _form_param(value: str) -> str:
+    """Escape a value for use inside a quoted Content-Disposition parameter."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', "%22")
+        .replace("\r", "%0D")
+        .replace("\n", "%0A")
+    )
+
+
+async def _iter_payload(
+    payload: memoryview, on_progress: Optional[Callable[[int], None]]
+) -> AsyncIterator[bytes]:
+    """Yield a payload in slices of itself, reporting the bytes sent so far."""
+    sent = 0
+    for offset in range(0, payload.nbytes, STREAM_PIECE_SIZE):
+        piece = payload[offset : offset + STREAM_PIECE_SIZE]
+        yield cast(bytes, piece)
+        # Resumed once the transport has taken the piece; each attempt of a
+        # retried request counts again from zero
+        sent += piece.nbytes
+        if on_progress:
+            on_progress(sent)
+
+
+class _RawBody:
+    """An application/octet-stream body: the payload alone, streamed in slices.
+
+    No framing is added around the payload, so nothing is encoded or buffered on
+    its way to the socket. ``on_progress`` is called with the bytes sent so far.
+    """
+
+    def __init__(
+        self, payload: ZenBuffer, on_progress: Optional[Callable[[int], None]] = None
+    ) -> None:
+        self._payload = to_memoryview(payload)
+        self._on_progress = on_progress
+        self.headers = {
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(self._payload.nbytes),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for piece in _iter_payload(self._payload, self._on_progress):
+            yield piece
+
+
+class _FormBody:
+    """A multipart/form-data body that streams its file part without copying it.
+
+    httpx's ``files=`` encoder wraps the payload in new ``bytes`` objects; this
+    body yields ``memoryview`` slices of the caller's buffer straight to the
+    transport, so the payload is only copied when it is written to the socket.
+    ``on_progress`` is called with the payload bytes sent so far.
+    """
+
+    def __init__(
+        self,
+        field: str,
+        filename: str,
+        content_type: str,
+        payload: ZenBuffer,
+        data: Optional[Dict[str, str]] = None,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        boundary = os.urandom(16).hex()
+        head = []
+        for name, value in (data or {}).items():
+            head.append(
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_form_param(name)}"\r\n'
+                f"\r\n{value}\r\n"
+            )
+        head.append(
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_form_param(field)}"; '
+            f'filename="{_form_param(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._head = "".join(head).encode("utf-8")
+        self._payload = to_memoryview(payload)
+        self._tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        self._on_progress = on_progress
+        self.headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(
+                len(self._head) + self._payload.nbytes + len(self._tail)
+            ),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        async for piece in _iter_payload(self._payload, self._on_progress):
+            yield piece
+        yield self._tail
 
 
 class ZenApi:
     """Handles API communication with FileZen."""
 
     def __init__(
-        self, *, api_key: Optional[str] = None, api_url: Optional[str] = None
+        self,
+        *,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        retry: Optional[ZenRetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        raw_uploads: bool = False,
     ) -> None:
         """Initialize ZenApi.
 
         Args:
             api_key: FileZen API key. If not provided, will use FILEZEN_API_KEY environment variable.
             api_url: Custom API URL. Defaults to https://api.filezen.dev
+            retry: Retry policy for transient failures. Defaults to ZenRetryPolicy();
+                pass ZenRetryPolicy(max_attempts=1) to disable retries.
+            max_connections: Maximum number of open connections. None for no limit.
+            max_keepalive_connections: Maximum number of idle connections kept open
+                for reuse. None for no limit.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Multiplex requests over HTTP/2 connections. Requires the
+                ``http2`` extra (``pip install filezen-python[http2]``).
+            transport: Shared httpx transport, e.g. one ``httpx.AsyncHTTPTransport``
+                used by many ZenApi instances. The pool options above are then
+                ignored, and ``close()`` leaves the transport open for its owner.
+            raw_uploads: Send file and chunk content as a raw
+                ``application/octet-stream`` body with the upload parameters in
+                headers, instead of as ``multipart/form-data``. Requires an API
+                that accepts raw uploads.
         """
         # Get API key from parameter or environment
         self.api_key = (
@@ -53,9 +182,25 @@ class ZenApi:
         if not self.api_url:
             raise ValueError("No API URL provided and DEFAULT_API_URL is not set")
 
+        self.retry = retry or ZenRetryPolicy()
+        self.raw_uploads = raw_uploads
+
+        # Connections come from a shared transport or a pool owned by this client
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+
         # Initialize HTTP client
         self.client = httpx.AsyncClient(
             base_url=self.api_url,
+            transport=transport,
             headers={
                 "ApiKey": self.api_key,
             },
@@ -66,6 +211,46 @@ class ZenApi:
                 pool=30.0,  # Pool timeout
             ),
         )
+        # Fetches URL sources from third-party origins, so it sends no API key
+        self.source_client = httpx.AsyncClient(
+            transport=transport, timeout=self.client.timeout
+        )
+
+    async def _request(
+        self, method: str, url: str, *, idempotent: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures per the retry policy.
+
+        Args:
+            method: HTTP method
+            url: Request URL, relative to the API URL
+            idempotent: Whether sending the request twice is harmless
+            **kwargs: Arguments for httpx.AsyncClient.request
+
+        Returns:
+            The successful response
+
+        Raises:
+            ZenError: The request failed; ``details["retries"]`` holds the number
+                of retries made before giving up
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.client.request(method, url, **kwargs)
+                response.raise_for_status()
+                return response
+            except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                delay = self.retry.next_delay(
+                    attempt, time.monotonic() - started, e, idempotent
+                )
+                if delay is None:
+                    error = build_zen_error(e)
+                    error.details["retries"] = attempt - 1
+                    raise error from e
+            await asyncio.sleep(delay)
 
     def set_authorization(self, authorization: Optional[str] = None) -> None:
         """Set authorization header.
@@ -79,13 +264,17 @@ class ZenApi:
             self.client.headers.pop("Authorization", None)
 
     async def upload_file(
-        self, source: bytes, params: Union[Dict[str, Any], ZenUploaderParams]
+        self,
+        source: ZenBuffer,
+        params: Union[Dict[str, Any], ZenUploaderParams],
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> ZenUploadResponse:
         """Upload a file to FileZen.
 
         Args:
-            source: File content as bytes
+            source: File content as bytes or any buffer-protocol object
             params: Upload parameters as dict or ZenUploaderParams
+            on_progress: Called with the bytes of source sent so far
 
         Returns:
             Upload result
@@ -94,37 +283,48 @@ class ZenApi:
         params = to_dataclass(ZenUploaderParams, params)
         params = cast(ZenUploaderParams, params)
 
-        try:
-            # Prepare multipart form data
-            files = {
-                "file": (
-                    params.name,
-                    source,
-                    params.mime_type or "application/octet-stream",
-                )
-            }
-
+        body: Union[_RawBody, _FormBody]
+        if self.raw_uploads:
+            # Parameters travel in headers; the name may be any Unicode string
+            body = _RawBody(source, on_progress)
+            headers = {**body.headers, "File-Name": quote(params.name, safe="")}
+            if params.mime_type:
+                headers["File-Mime-Type"] = params.mime_type
+            if params.metadata:
+                headers["File-Metadata"] = json.dumps(params.metadata)
+            if params.project_id:
+                headers["Project-Id"] = params.project_id
+            if params.folder_id:
+                headers["Folder-Id"] = params.folder_id
+        else:
             # Additional form data
             data = {}
             if params.mime_type:
                 data["mimeType"] = params.mime_type
             if params.metadata:
                 # Serialize metadata to JSON string for form data
-                import json
-
                 data["metadata"] = json.dumps(params.metadata)
             if params.project_id:
                 data["projectId"] = params.project_id
             if params.folder_id:
                 data["folderId"] = params.folder_id
 
-            response = await self.client.post("/files/upload", files=files, data=data)
-            response.raise_for_status()
+            # Prepare multipart form data
+            body = _FormBody(
+                "file",
+                params.name,
+                params.mime_type or "application/octet-stream",
+                source,
+                data,
+                on_progress,
+            )
+            headers = body.headers
 
-            return ZenUploadResponse.from_dict({"data": response.json()})
+        response = await self._request(
+            "POST", "/files/upload", content=body, headers=headers
+        )
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return ZenUploadResponse.from_dict({"data": response.json()})
 
     async def initialize_multipart_upload(
         self, params: Union[Dict[str, Any], StartMultipartUploadParams]
@@ -141,90 +341,102 @@ class ZenApi:
         params = to_dataclass(StartMultipartUploadParams, params)
         params = cast(StartMultipartUploadParams, params)
 
-        try:
-            # Convert dataclass to dict for API
-            api_params = {
-                "fileName": params.file_name,
-                "mimeType": params.mime_type,
-            }
-            if params.total_size is not None:
-                api_params["totalSize"] = str(params.total_size)
-            if params.chunk_size is not None:
-                api_params["chunkSize"] = str(params.chunk_size)
-            if params.metadata is not None:
-                import json
-
-                api_params["metadata"] = json.dumps(params.metadata)
-            if params.upload_mode is not None:
-                api_params["uploadMode"] = params.upload_mode.value
-            if params.parent_id is not None:
-                api_params["parentId"] = params.parent_id
-            if params.project_id is not None:
-                api_params["projectId"] = params.project_id
-
-            response = await self.client.post(
-                "/files/chunk-upload/initialize", json=api_params
-            )
-            response.raise_for_status()
-
-            return ZenMultipartInitResponse.from_dict({"data": response.json()})
+        # Convert dataclass to dict for API
+        api_params = {
+            "fileName": params.file_name,
+            "mimeType": params.mime_type,
+        }
+        if params.total_size is not None:
+            api_params["totalSize"] = str(params.total_size)
+        if params.chunk_size is not None:
+            api_params["chunkSize"] = str(params.chunk_size)
+        if params.metadata is not None:
+            api_params["metadata"] = json.dumps(params.metadata)
+        if params.upload_mode is not None:
+            api_params["uploadMode"] = params.upload_mode.value
+        if params.parent_id is not None:
+            api_params["parentId"] = params.parent_id
+        if params.project_id is not None:
+            api_params["projectId"] = params.project_id
+
+        response = await self._request(
+            "POST", "/files/chunk-upload/initialize", json=api_params
+        )
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return ZenMultipartInitResponse.from_dict({"data": response.json()})
 
     async def upload_chunk(
-        self, session_id: str, chunk: bytes, chunk_index: int, chunk_size: int
+        self,
+        session_id: str,
+        chunk: ZenBuffer,
+        chunk_index: int,
+        chunk_size: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+        checksum: Optional[str] = None,
     ) -> ZenMultipartChunkResponse:
         """Upload a chunk in multipart upload.
 
         Args:
             session_id: Multipart upload session ID
-            chunk: Chunk data
+            chunk: Chunk data as bytes or a memoryview slice of the source
             chunk_index: Index of the chunk
             chunk_size: Size of the chunk
+            on_progress: Called with the bytes of the chunk sent so far
+            checksum: Digest of the chunk, as ``sha256:<hex>``
 
         Returns:
             Chunk upload result
         """
-        try:
-            files = {
-                "chunk": (f"chunk_{chunk_index}", chunk, "application/octet-stream")
-            }
-            headers = {
-                "Chunk-Session-Id": session_id,
-                "Chunk-Size": str(chunk_size),
-                "Chunk-Index": str(chunk_index),
-            }
-
-            response = await self.client.post(
-                "/files/chunk-upload/part", files=files, headers=headers
+        body: Union[_RawBody, _FormBody]
+        if self.raw_uploads:
+            body = _RawBody(chunk, on_progress)
+        else:
+            body = _FormBody(
+                "chunk",
+                f"chunk_{chunk_index}",
+                "application/octet-stream",
+                chunk,
+                on_progress=on_progress,
             )
-            response.raise_for_status()
-
-            return ZenMultipartChunkResponse.from_dict({"data": response.json()})
+        headers = {
+            **body.headers,
+            "Chunk-Session-Id": session_id,
+            "Chunk-Size": str(chunk_size),
+            "Chunk-Index": str(chunk_index),
+        }
+        if checksum:
+            headers["Chunk-Checksum"] = checksum
+
+        # Parts are idempotent - resending an index replaces the same chunk
+        response = await self._request(
+            "POST",
+            "/files/chunk-upload/part",
+            idempotent=True,
+            content=body,
+            headers=headers,
+        )
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return ZenMultipartChunkResponse.from_dict({"data": response.json()})
 
-    async def finish_multipart_upload(self, session_id: str) -> ZenFile:
+    async def finish_multipart_upload(
+        self, session_id: str, checksum: Optional[str] = None
+    ) -> ZenFile:
         """Finish a multipart upload session.
 
         Args:
             session_id: Multipart upload session ID
+            checksum: Composite digest of the file's chunks, as ``sha256:<hex>-<n>``
 
         Returns:
             Finish result with file information
         """
-        try:
-            response = await self.client.post(
-                f"/files/chunk-upload/finish/{session_id}"
-            )
-            response.raise_for_status()
-
-            return ZenFile.from_dict(response.json())
+        response = await self._request(
+            "POST",
+            f"/files/chunk-upload/finish/{session_id}",
+            headers={"File-Checksum": checksum} if checksum else None,
+        )
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return ZenFile.from_dict(response.json())
 
     async def delete_file_by_url(self, url: str) -> bool:
         """Delete a file by URL.
@@ -235,41 +447,36 @@ class ZenApi:
         Returns:
             Delete result
         """
-        try:
-            response = await self.client.delete(
-                "/files/delete-by-url", params={"url": url}
-            )
-            response.raise_for_status()
-
-            return True
+        await self._request(
+            "DELETE", "/files/delete-by-url", idempotent=True, params={"url": url}
+        )
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return True
 
     async def list_files(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> ZenList:
         """List files.
 
         Args:
             limit: Number of files to return (default: 20)
             offset: Number of files to skip (default: 0)
+            cursor: ``next_cursor`` of the previous page, instead of an offset
 
         Returns:
             List of files
         """
-        try:
-            params = {
-                "limit": limit or 20,
-                "offset": offset or 0,
-            }
-            response = await self.client.get("/files", params=params)
-            response.raise_for_status()
-
-            return ZenList.from_dict(response.json())
+        params: Dict[str, Union[str, int]] = {"limit": limit or 20}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset or 0
+        response = await self._request("GET", "/files", idempotent=True, params=params)
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return ZenList.from_dict(response.json())
 
     async def file_info(self, file_id: str) -> ZenFile:
         """Get file information.
@@ -280,14 +487,9 @@ class ZenApi:
         Returns:
             File information
         """
-        try:
-            response = await self.client.get(f"/files/{file_id}")
-            response.raise_for_status()
+        response = await self._request("GET", f"/files/{file_id}", idempotent=True)
 
-            return ZenFile.from_dict(response.json())
-
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return ZenFile.from_dict(response.json())
 
     async def update_file(
         self,
@@ -303,14 +505,11 @@ class ZenApi:
         Returns:
             Updated file information
         """
-        try:
-            response = await self.client.patch(f"/files/{file_id}", json=params)
-            response.raise_for_status()
-
-            return ZenFile.from_dict(response.json())
+        response = await self._request(
+            "PATCH", f"/files/{file_id}", idempotent=True, json=params
+        )
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return ZenFile.from_dict(response.json())
 
     async def delete_file(self, file_id: str) -> bool:
         """Delete a file by ID.
@@ -321,18 +520,18 @@ class ZenApi:
         Returns:
             True if successful
         """
-        try:
-            response = await self.client.delete(f"/files/{file_id}")
-            response.raise_for_status()
-
-            return True
+        await self._request("DELETE", f"/files/{file_id}", idempotent=True)
 
-        except (httpx.HTTPStatusError, httpx.RequestError) as e:
-            raise build_zen_error(e) from e
+        return True
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP clients.
+
+        A shared transport passed to the constructor is left open.
+        """
+        if self._owns_transport:
+            await self.client.aclose()
+            await self.source_client.aclose()
 
     async def __aenter__(self) -> "ZenApi":
         """Async context manager entry."""
@@ -0,0 +1,75 @@
+"""In-flight byte budget for the FileZen Python SDK."""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Tuple
+
+
+class ByteBudget:
+    """Limits the bytes held by concurrently running uploads.
+
+    Reservations are granted in arrival order, so a large upload is not starved
+    by a stream of small ones. A reservation larger than the whole budget is
+    clamped to it and runs once everything else has been released.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit <= 0:
+            raise ValueError("Byte budget limit must be positive")
+        self.limit = limit
+        self.used = 0
+        self._waiters: Deque[Tuple[int, asyncio.Future[None]]] = deque()
+
+    async def acquire(self, size: int) -> int:
+        """Wait until ``size`` bytes are available and reserve them.
+
+        Returns:
+            The number of bytes reserved, to be passed to release()
+        """
+        size = max(0, min(size, self.limit))
+        if not self._waiters and self.used + size <= self.limit:
+            self.used += size
+            return size
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append((size, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we were cancelled - hand the bytes back
+                self.release(size)
+            else:
+                # _grant may already have dropped the cancelled waiter
+                if (size, waiter) in self._waiters:
+                    self._waiters.remove((size, waiter))
+                self._grant()
+            raise
+        return size
+
+    def release(self, size: int) -> None:
+        """Return bytes reserved by acquire()."""
+        self.used -= size
+        self._grant()
+
+    def _grant(self) -> None:
+        while self._waiters:
+            size, waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if self.used + size > self.limit:
+                return
+            self._waiters.popleft()
+            self.used += size
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def reserve(self, size: int) -> AsyncIterator[None]:
+        """Hold ``size`` bytes of the budget for the duration of the block."""
+        reserved = await self.acquire(size)
+        try:
+            yield
+        finally:
+            self.release(reserved)
@@ -0,0 +1,97 @@
+"""Completed item checkpoint for the FileZen Python SDK."""
+
+import asyncio
+import json
+import os
+from typing import Iterable, List, Optional, Set, Union
+
+
+class ZenUploadCheckpoint:
+    """Records the keys of completed uploads so a restarted job can skip them.
+
+    Keys are appended to a file, one JSON string per line, as uploads complete.
+    A torn final line left by a crash is ignored on load. Loaded keys are kept
+    in memory. Keys are compared as strings, so an item keyed ``42`` matches
+    one recorded as ``"42"``.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Initialize ZenUploadCheckpoint.
+
+        Args:
+            path: Checkpoint file. Created on the first completed upload; keys
+                already recorded in it are loaded.
+        """
+        self.path = os.fspath(path)
+        self._keys: Set[str] = set()
+        # Keys recorded but not yet written, and the task writing them
+        self._unwritten: List[str] = []
+        self._writing: Optional[asyncio.Future[None]] = None
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                # Only newline-terminated lines were written completely
+                lines = f.read().split("\n")[:-1]
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                key = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(key, str):
+                self._keys.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return str(key) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Union[str, int]) -> None:
+        """Record that the item with key completed, writing it at once."""
+        name = str(key)
+        if name in self._keys:
+            return
+        self._write([name])
+        self._keys.add(name)
+
+    async def record(self, key: Union[str, int]) -> None:
+        """Record that the item with key completed, writing off the event loop.
+
+        Returns once the key is written. Keys recorded while a write is in
+        progress are written together by the next one.
+        """
+        name = str(key)
+        if name in self._keys:
+            return
+        self._keys.add(name)
+        self._unwritten.append(name)
+        if self._writing is None:
+            self._writing = asyncio.ensure_future(self._write_unwritten())
+        # A cancelled caller leaves the write running for the others
+        await asyncio.shield(self._writing)
+
+    async def flush(self) -> None:
+        """Wait for keys recorded so far to be written."""
+        if self._writing is not None:
+            await asyncio.shield(self._writing)
+
+    async def _write_unwritten(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._unwritten:
+                keys, self._unwritten = self._unwritten, []
+                try:
+                    await loop.run_in_executor(None, self._write, keys)
+                except BaseException:
+                    # Retried by the next write
+                    self._unwritten[:0] = keys
+                    raise
+        finally:
+            self._writing = None
+
+    def _write(self, keys: Iterable[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(key) + "\n" for key in keys))
@@ -0,0 +1,80 @@
+"""Adaptive multipart chunk sizing for the FileZen Python SDK."""
+
+from typing import Optional
+
+from .constants import (
+    MULTIPART_CHUNK_SIZE,
+    MULTIPART_MAX_CHUNK_SIZE,
+    MULTIPART_MIN_CHUNK_SIZE,
+    MULTIPART_TARGET_CHUNK_SECONDS,
+)
+
+# Adaptive chunk sizes are rounded down to a multiple of this
+_CHUNK_ALIGNMENT = 256 * 1024
+
+
+class ZenChunkSizer:
+    """Picks multipart chunk sizes from measured upload throughput.
+
+    Every chunk upload reports its size and round-trip time. Throughput is
+    tracked as an exponentially weighted average and the chunk size follows it,
+    so one chunk takes about ``target_seconds`` to send: fast links get large
+    chunks that amortize per-request overhead, slow or flaky links get small
+    chunks that waste little when one fails. Each step at most doubles or halves
+    the size, and a failed chunk halves it.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_chunk_size: int = MULTIPART_MIN_CHUNK_SIZE,
+        max_chunk_size: int = MULTIPART_MAX_CHUNK_SIZE,
+        target_seconds: float = MULTIPART_TARGET_CHUNK_SECONDS,
+        initial_chunk_size: int = MULTIPART_CHUNK_SIZE,
+        smoothing: float = 0.3,
+    ) -> None:
+        """Initialize ZenChunkSizer.
+
+        Args:
+            min_chunk_size: Smallest chunk size to pick
+            max_chunk_size: Largest chunk size to pick
+            target_seconds: Time one chunk should take to upload
+            initial_chunk_size: Chunk size before anything has been measured
+            smoothing: Weight of the newest sample in the averages (0-1)
+        """
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_seconds = target_seconds
+        self.smoothing = smoothing
+        self.throughput: Optional[float] = None  # bytes per second
+        self.rtt: Optional[float] = None  # seconds per chunk request
+        self._chunk_size = self._clamp(initial_chunk_size)
+
+    @property
+    def chunk_size(self) -> int:
+        """Chunk size to use for the next chunk or multipart session."""
+        return self._chunk_size
+
+    def record(self, size: int, seconds: float) -> None:
+        """Record a chunk of ``size`` bytes that took ``seconds`` to upload."""
+        if size <= 0 or seconds <= 0:
+            return
+        self.rtt = self._average(self.rtt, seconds)
+        self.throughput = self._average(self.throughput, size / seconds)
+
+        desired = self.throughput * self.target_seconds
+        desired = min(max(desired, self._chunk_size / 2), self._chunk_size * 2)
+        self._chunk_size = self._clamp(int(desired))
+
+    def record_failure(self) -> None:
+        """Record a failed chunk upload - back off to smaller chunks."""
+        self._chunk_size = self._clamp(self._chunk_size // 2)
+
+    def _average(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self.smoothing * (sample - current)
+
+    def _clamp(self, size: int) -> int:
+        size = min(max(size, self.min_chunk_size), self.max_chunk_size)
+        return max(self.min_chunk_size, size - size % _CHUNK_ALIGNMENT)
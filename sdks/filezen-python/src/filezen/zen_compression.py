@@ -0,0 +1,109 @@
+"""Upload compression for the FileZen Python SDK."""
+
+import asyncio
+import zlib
+from typing import Any, AsyncIterator, Optional
+
+from .constants import COMPRESSION_MIN_RATIO, COMPRESSION_MIN_SIZE
+from .types import ZenBuffer
+from .zen_error import ZenError
+
+try:
+    import zstandard
+except ImportError:  # Optional: the zstd extra
+    zstandard = None  # type: ignore[assignment]
+
+# Values of ZenStorage(compression=...)
+COMPRESSION_ENCODINGS = ("gzip", "zstd")
+
+# Non-text MIME types worth compressing; text/*, +json and +xml always are
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "application/x-javascript",
+    "application/csv",
+    "application/yaml",
+    "application/x-yaml",
+    "application/toml",
+    "application/sql",
+    "application/graphql",
+    "application/wasm",
+    "image/svg+xml",
+    "image/bmp",
+}
+
+
+def is_compressible_type(mime_type: Optional[str]) -> bool:
+    """Whether content of a MIME type is usually compressible."""
+    if not mime_type:
+        return False
+    base = mime_type.split(";", 1)[0].strip().lower()
+    return (
+        base.startswith("text/")
+        or base in _COMPRESSIBLE_TYPES
+        or base.endswith(("+json", "+xml"))
+    )
+
+
+def looks_compressible(sample: ZenBuffer, size: Optional[int] = None) -> bool:
+    """Whether compressing a sample of the content saves enough to be worth it.
+
+    Args:
+        sample: The first bytes of the content
+        size: Total size of the content, if known
+    """
+    if (size if size is not None else len(sample)) < COMPRESSION_MIN_SIZE:
+        return False
+    compressed = zlib.compress(sample, 1)
+    return len(compressed) <= len(sample) * COMPRESSION_MIN_RATIO
+
+
+def new_compressor(encoding: str) -> Any:
+    """Return a streaming compressor with ``compress`` and ``flush`` methods.
+
+    Raises:
+        ZenError: The encoding is unknown, or its library is not installed
+    """
+    if encoding == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if encoding == "zstd":
+        if zstandard is None:
+            raise ZenError(
+                "zstd compression requires the zstd extra: "
+                "pip install 'filezen-python[zstd]'"
+            )
+        return zstandard.ZstdCompressor().compressobj()
+    raise ZenError(
+        f"Unsupported compression {encoding!r}; "
+        f"use one of {', '.join(COMPRESSION_ENCODINGS)}"
+    )
+
+
+async def compress(data: ZenBuffer, encoding: str) -> bytes:
+    """Compress a buffer in one go, off the event loop."""
+    compressor = new_compressor(encoding)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _compress_all, compressor, data)
+
+
+def _compress_all(compressor: Any, data: ZenBuffer) -> bytes:
+    return bytes(compressor.compress(data)) + bytes(compressor.flush())
+
+
+async def compress_pieces(
+    pieces: AsyncIterator[ZenBuffer], encoding: str
+) -> AsyncIterator[bytes]:
+    """Compress a stream piece by piece, off the event loop.
+
+    Pieces are compressed as they arrive, so the compressed stream can be
+    chunked and sent while later pieces are still being read and compressed.
+    """
+    compressor = new_compressor(encoding)
+    loop = asyncio.get_running_loop()
+    async for piece in pieces:
+        compressed = await loop.run_in_executor(None, compressor.compress, piece)
+        if compressed:
+            yield compressed
+    yield await loop.run_in_executor(None, compressor.flush)
@@ -0,0 +1,204 @@
+"""Content deduplication for the FileZen Python SDK."""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Union
+
+from .types import ZenFile
+from .zen_source import content_digest
+
+if TYPE_CHECKING:
+    from .zen_upload import ZenUpload
+
+
+class ZenDedupIndex(ABC):
+    """Index of uploaded files by content key, used to skip repeat uploads.
+
+    Subclass to keep the index elsewhere, e.g. in Redis shared by many workers.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[ZenFile]:
+        """Return the file uploaded under key, if any."""
+
+    @abstractmethod
+    async def put(self, key: str, file: ZenFile) -> None:
+        """Record the file uploaded under key."""
+
+    @abstractmethod
+    async def discard(
+        self, *, file_id: Optional[str] = None, url: Optional[str] = None
+    ) -> None:
+        """Forget the file with this ID or URL, e.g. after it was deleted."""
+
+
+class ZenMemoryDedupIndex(ZenDedupIndex):
+    """In-process dedup index keeping the most recently used entries."""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """Initialize ZenMemoryDedupIndex.
+
+        Args:
+            max_entries: Most entries to keep; least recently used go first.
+        """
+        self.max_entries = max_entries
+        self._files: OrderedDict[str, ZenFile] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[ZenFile]:
+        file = self._files.get(key)
+        if file is not None:
+            self._files.move_to_end(key)
+        return file
+
+    async def put(self, key: str, file: ZenFile) -> None:
+        self._files[key] = file
+        self._files.move_to_end(key)
+        while len(self._files) > self.max_entries:
+            self._files.popitem(last=False)
+
+    async def discard(
+        self, *, file_id: Optional[str] = None, url: Optional[str] = None
+    ) -> None:
+        stale = [
+            key
+            for key, file in self._files.items()
+            if (file_id is not None and file.id == file_id)
+            or (url is not None and file.url == url)
+        ]
+        for key in stale:
+            del self._files[key]
+
+
+class ZenSQLiteDedupIndex(ZenDedupIndex):
+    """Dedup index persisted in a SQLite database, queried off the event loop."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Initialize ZenSQLiteDedupIndex.
+
+        Args:
+            path: Database file. Created if missing.
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS zen_dedup "
+                "(key TEXT PRIMARY KEY, file_id TEXT NOT NULL, url TEXT, file TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS zen_dedup_file_id ON zen_dedup (file_id)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS zen_dedup_url ON zen_dedup (url)"
+            )
+
+    async def _execute(self, sql: str, *params: Optional[str]) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._execute_sync, sql, params)
+
+    def _execute_sync(self, sql: str, params: tuple) -> Optional[str]:
+        with self._lock, self._db:
+            row = self._db.execute(sql, params).fetchone()
+        return row[0] if row else None
+
+    async def get(self, key: str) -> Optional[ZenFile]:
+        data = await self._execute("SELECT file FROM zen_dedup WHERE key = ?", key)
+        return ZenFile.from_dict(json.loads(data)) if data else None
+
+    async def put(self, key: str, file: ZenFile) -> None:
+        await self._execute(
+            "INSERT OR REPLACE INTO zen_dedup (key, file_id, url, file) "
+            "VALUES (?, ?, ?, ?)",
+            key,
+            file.id,
+            file.url,
+            json.dumps(file.to_dict()),
+        )
+
+    async def discard(
+        self, *, file_id: Optional[str] = None, url: Optional[str] = None
+    ) -> None:
+        if file_id is not None:
+            await self._execute("DELETE FROM zen_dedup WHERE file_id = ?", file_id)
+        if url is not None:
+            await self._execute("DELETE FROM zen_dedup WHERE url = ?", url)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+class Deduplicator:
+    """Skips uploads whose content was already uploaded to the same place.
+
+    An upload's key combines a SHA-256 of its content with its name, MIME type,
+    destination and metadata. A key found in the index completes the upload
+    with the recorded file. Concurrent uploads with the same key wait for the
+    first one instead of sending the content again; if it fails, the next
+    waiter uploads.
+    """
+
+    def __init__(self, index: ZenDedupIndex) -> None:
+        self.index = index
+        self._in_flight: Dict[str, asyncio.Future[None]] = {}
+
+    async def key_for(self, upload: "ZenUpload") -> Optional[str]:
+        """Dedup key of an upload, or None if its source cannot be hashed."""
+        if upload.source_kind == "url":
+            return None
+        digest = await content_digest(upload.source)
+        if digest is None:
+            return None
+        scope = json.dumps(
+            [
+                upload.name,
+                upload.mime_type,
+                upload.folder,
+                upload.folder_id,
+                upload.project_id,
+                upload.metadata,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(f"{digest}|{scope}".encode()).hexdigest()
+
+    async def upload(
+        self, upload: "ZenUpload", send: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Complete upload from the index, a concurrent upload, or by sending it."""
+        key = await self.key_for(upload)
+        if key is None:
+            await send()
+            return
+
+        while True:
+            file = await self.index.get(key)
+            if file is not None:
+                upload.file = file
+                upload.deduplicated = True
+                return
+
+            leader = self._in_flight.get(key)
+            if leader is None:
+                break
+            # Waiting does not raise if the leader fails; then retry as leader
+            await asyncio.wait({leader})
+
+        done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = done
+        try:
+            await send()
+            if upload.file is not None:
+                await self.index.put(key, upload.file)
+        finally:
+            del self._in_flight[key]
+            done.set_result(None)
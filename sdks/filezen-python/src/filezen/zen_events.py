@@ -0,0 +1,93 @@
+"""Background listener dispatch for the FileZen Python SDK."""
+
+import asyncio
+import inspect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+
+class ListenerDispatcher:
+    """Delivers listener events in order, off the upload's hot path.
+
+    Events are queued and delivered by a background task: ``async def``
+    callbacks are awaited on the event loop, others run on a dedicated thread,
+    so a slow listener delays only later events, never uploads. Pending
+    ``on_uploads_change`` events are coalesced into one, whose uploads list is
+    taken when it is delivered. Once ``max_pending`` events are waiting, new
+    progress events are dropped - later ones supersede them.
+    """
+
+    def __init__(
+        self,
+        listeners: Sequence[Any],
+        get_uploads: Callable[[], List[Any]],
+        max_pending: int,
+    ) -> None:
+        self._listeners = listeners
+        self._get_uploads = get_uploads
+        self.max_pending = max(1, max_pending)
+        self.dropped = 0
+        self._events: Deque[Tuple[str, Tuple[Any, ...]]] = deque()
+        self._uploads_change_pending = False
+        self._drain_task: Optional[asyncio.Future[None]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def emit(self, event: str, *args: Any) -> None:
+        """Queue an event for every listener."""
+        if event == "on_uploads_change":
+            if self._uploads_change_pending:
+                return
+            self._uploads_change_pending = True
+        elif event == "on_upload_progress" and len(self._events) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._events.append((event, args))
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Delivered once events are emitted from a running loop
+            return
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._events:
+            event, args = self._events.popleft()
+            if event == "on_uploads_change":
+                self._uploads_change_pending = False
+                args = (self._get_uploads(),)
+            for listener in list(self._listeners):
+                callback = getattr(listener, event, None)
+                if callback:
+                    await self._deliver(event, callback, args)
+
+    async def _deliver(
+        self, event: str, callback: Callable[..., Any], args: Tuple[Any, ...]
+    ) -> None:
+        try:
+            if inspect.iscoroutinefunction(callback):
+                await callback(*args)
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="filezen-listeners"
+                    )
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._executor, partial(callback, *args))
+        except Exception as e:
+            # Log error but don't stop delivering events
+            print(f"Error in listener {event}: {e}")
+
+    async def close(self) -> None:
+        """Deliver the events still queued, then stop the listener thread."""
+        self._wake()
+        if self._drain_task is not None:
+            await self._drain_task
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,135 @@
+"""Multipart upload session journal for the FileZen Python SDK."""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Union
+
+
+@dataclass
+class ZenJournalEntry:
+    """A multipart upload session recorded in the journal."""
+
+    session_id: str
+    source_id: str
+    chunk_size: int
+    total_size: int
+    acknowledged: Set[int] = field(default_factory=set)
+
+
+class ZenUploadJournal:
+    """Persists multipart upload sessions so interrupted uploads can resume.
+
+    Each session is an append-only file in ``directory``: a JSON header line
+    followed by one line per acknowledged chunk index. Appends are crash safe -
+    a torn final line is ignored when the entry is loaded.
+
+    Uploads record acknowledged chunks with ``record``, which appends off the
+    event loop; the other methods block and are run in an executor.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]) -> None:
+        """Initialize ZenUploadJournal.
+
+        Args:
+            directory: Directory to keep journal files in. Created if missing.
+        """
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        # Chunk indexes recorded but not yet written by key, and the task
+        # writing them
+        self._unwritten: Dict[str, List[int]] = {}
+        self._writing: Optional[asyncio.Future[None]] = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.journal")
+
+    def load(self, key: str) -> Optional[ZenJournalEntry]:
+        """Load the session recorded under key, if any."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                # Only newline-terminated lines were written completely
+                lines = f.read().split("\n")[:-1]
+        except FileNotFoundError:
+            return None
+
+        try:
+            header = json.loads(lines[0])
+            entry = ZenJournalEntry(
+                session_id=header["sessionId"],
+                source_id=header["sourceId"],
+                chunk_size=int(header["chunkSize"]),
+                total_size=int(header["totalSize"]),
+            )
+        except (ValueError, KeyError, IndexError):
+            return None
+
+        for line in lines[1:]:
+            if line.isdigit():
+                entry.acknowledged.add(int(line))
+        return entry
+
+    def start(self, key: str, entry: ZenJournalEntry) -> None:
+        """Record a new session under key, replacing any previous one."""
+        header = {
+            "sessionId": entry.session_id,
+            "sourceId": entry.source_id,
+            "chunkSize": entry.chunk_size,
+            "totalSize": entry.total_size,
+        }
+        tmp_path = self._path(key) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+            for chunk_index in sorted(entry.acknowledged):
+                f.write(f"{chunk_index}\n")
+        os.replace(tmp_path, self._path(key))
+
+    def acknowledge(self, key: str, chunk_index: int) -> None:
+        """Record that the server acknowledged a chunk of the session."""
+        with open(self._path(key), "a", encoding="utf-8") as f:
+            f.write(f"{chunk_index}\n")
+
+    async def record(self, key: str, chunk_index: int) -> None:
+        """Record an acknowledged chunk of the session, writing off the event loop.
+
+        Returns once the chunk is written. Chunks recorded while a write is in
+        progress are written together by the next one.
+        """
+        self._unwritten.setdefault(key, []).append(chunk_index)
+        if self._writing is None:
+            self._writing = asyncio.ensure_future(self._write_unwritten())
+        # A cancelled caller leaves the write running for the others
+        await asyncio.shield(self._writing)
+
+    async def flush(self) -> None:
+        """Wait for chunks recorded so far to be written."""
+        if self._writing is not None:
+            await asyncio.shield(self._writing)
+
+    async def _write_unwritten(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._unwritten:
+                chunks, self._unwritten = self._unwritten, {}
+                try:
+                    await loop.run_in_executor(None, self._append, chunks)
+                except BaseException:
+                    # Retried by the next write
+                    for key, indexes in chunks.items():
+                        self._unwritten.setdefault(key, [])[:0] = indexes
+                    raise
+        finally:
+            self._writing = None
+
+    def _append(self, chunks: Dict[str, List[int]]) -> None:
+        for key, indexes in chunks.items():
+            with open(self._path(key), "a", encoding="utf-8") as f:
+                f.write("".join(f"{chunk_index}\n" for chunk_index in indexes))
+
+    def remove(self, key: str) -> None:
+        """Forget the session recorded under key."""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,118 @@
+"""Priority upload queue for the FileZen Python SDK."""
+
+import asyncio
+from collections import deque
+from enum import IntEnum
+from functools import partial
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
+
+from .zen_upload import ZenUpload
+
+
+class ZenUploadPriority(IntEnum):
+    """Priority classes for queued uploads. Lower values run first."""
+
+    HIGH = 0  # Interactive, latency-sensitive uploads
+    NORMAL = 1
+    LOW = 2  # Backfills and other bulk traffic
+
+
+# An upload waiting to start, and the future of its result
+_QueuedUpload = Tuple[ZenUpload, "asyncio.Future[ZenUpload]"]
+
+
+class UploadQueue:
+    """Runs queued uploads on a bounded pool, highest priority first.
+
+    At most ``workers`` uploads run at once, and at most ``class_limits[p]`` of
+    priority ``p``. Uploads of the same priority start in the order queued. A
+    class at its limit does not hold up the classes below it.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[ZenUpload], Awaitable[ZenUpload]],
+        *,
+        workers: int,
+        class_limits: Optional[Dict[int, int]] = None,
+    ) -> None:
+        self._run = run
+        self.workers = max(1, workers)
+        self.class_limits = dict(class_limits or {})
+        # Queued uploads and their futures, by priority
+        self._pending: Dict[int, Deque[_QueuedUpload]] = {}
+        self._active: Dict[int, int] = {}
+        self._tasks: Set[asyncio.Future[ZenUpload]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of uploads waiting to start."""
+        return sum(len(entries) for entries in self._pending.values())
+
+    @property
+    def running(self) -> int:
+        """Number of uploads in progress."""
+        return len(self._tasks)
+
+    def put(self, upload: ZenUpload, priority: int) -> "asyncio.Future[ZenUpload]":
+        """Queue an upload.
+
+        Returns:
+            A future resolving to the completed upload, or raising its error.
+            Cancelling the future cancels the upload.
+        """
+        future: asyncio.Future[ZenUpload] = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(int(priority), deque()).append((upload, future))
+        self._dispatch()
+        return future
+
+    def _dispatch(self) -> None:
+        """Start queued uploads while workers and class limits allow."""
+        for priority in sorted(self._pending):
+            entries = self._pending[priority]
+            limit = self.class_limits.get(priority)
+            while entries and len(self._tasks) < self.workers:
+                if limit is not None and self._active.get(priority, 0) >= limit:
+                    break
+                upload, future = entries.popleft()
+                if not future.cancelled():
+                    self._start(priority, upload, future)
+
+    def _start(
+        self, priority: int, upload: ZenUpload, future: "asyncio.Future[ZenUpload]"
+    ) -> None:
+        self._active[priority] = self._active.get(priority, 0) + 1
+        task = asyncio.ensure_future(self._run(upload))
+        self._tasks.add(task)
+        future.add_done_callback(lambda f: task.cancel() if f.cancelled() else None)
+        task.add_done_callback(partial(self._finished, priority, upload, future))
+
+    def _finished(
+        self,
+        priority: int,
+        upload: ZenUpload,
+        future: "asyncio.Future[ZenUpload]",
+        task: "asyncio.Future[ZenUpload]",
+    ) -> None:
+        self._active[priority] -= 1
+        self._tasks.discard(task)
+        if not future.done():
+            if task.cancelled():
+                future.cancel()
+            elif upload.error:
+                future.set_exception(upload.error)
+            else:
+                future.set_result(upload)
+        self._dispatch()
+
+    async def close(self) -> None:
+        """Cancel queued and running uploads."""
+        for entries in self._pending.values():
+            for _, future in entries:
+                future.cancel()
+            entries.clear()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,143 @@
+"""Upload registry for the FileZen Python SDK."""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional
+
+from .zen_upload import UPLOAD_STATES, ZenUpload
+
+
+class ZenUploadRegistry:
+    """Uploads kept by a ZenStorage, indexed by state.
+
+    Uploads are looked up by ``local_id``. Per-state indexes make state queries
+    proportional to the result, and counts constant-time. Finished uploads are
+    evicted least recently used first once there are more than ``max_size``
+    uploads, and after ``ttl`` seconds without being looked up. Active uploads
+    are never evicted.
+    """
+
+    def __init__(
+        self, *, max_size: Optional[int] = None, ttl: Optional[float] = None
+    ) -> None:
+        """Initialize ZenUploadRegistry.
+
+        Args:
+            max_size: Most uploads to keep. Unlimited by default.
+            ttl: Seconds a finished upload is kept after it finished or was last
+                looked up. Unlimited by default.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._uploads: Dict[str, ZenUpload] = {}
+        self._states: Dict[str, Dict[str, ZenUpload]] = {
+            state: {} for state in UPLOAD_STATES
+        }
+        self._state_of: Dict[str, str] = {}
+        # Finished uploads, least recently used first, with their last use
+        self._finished: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, upload: ZenUpload) -> None:
+        """Keep an upload."""
+        self._uploads[upload.local_id] = upload
+        self._index(upload)
+        self._evict()
+
+    def update(self, upload: ZenUpload) -> None:
+        """Re-index a kept upload after its state changed."""
+        if upload.local_id in self._uploads:
+            self._index(upload)
+            self._evict()
+
+    def remove(self, local_id: str) -> Optional[ZenUpload]:
+        """Stop keeping an upload, returning it if it was kept."""
+        upload = self._uploads.pop(local_id, None)
+        if upload is not None:
+            state = self._state_of.pop(local_id)
+            del self._states[state][local_id]
+            self._finished.pop(local_id, None)
+        return upload
+
+    def _index(self, upload: ZenUpload) -> None:
+        local_id = upload.local_id
+        state = upload.state
+        previous = self._state_of.get(local_id)
+        if previous != state:
+            if previous is not None:
+                del self._states[previous][local_id]
+            self._states[state][local_id] = upload
+            self._state_of[local_id] = state
+        if state != "active":
+            self._touch(local_id)
+
+    def _touch(self, local_id: str) -> None:
+        self._finished[local_id] = time.monotonic()
+        self._finished.move_to_end(local_id)
+
+    def _evict(self) -> None:
+        if self.ttl is not None:
+            expired = time.monotonic() - self.ttl
+            while self._finished:
+                local_id, used_at = next(iter(self._finished.items()))
+                if used_at > expired:
+                    break
+                self.remove(local_id)
+        if self.max_size is not None:
+            while len(self._uploads) > self.max_size and self._finished:
+                self.remove(next(iter(self._finished)))
+
+    def get(self, local_id: str) -> Optional[ZenUpload]:
+        """Look up an upload by ``local_id``."""
+        self._evict()
+        upload = self._uploads.get(local_id)
+        if upload is not None and local_id in self._finished:
+            self._touch(local_id)
+        return upload
+
+    def __getitem__(self, local_id: str) -> ZenUpload:
+        upload = self.get(local_id)
+        if upload is None:
+            raise KeyError(local_id)
+        return upload
+
+    def __contains__(self, local_id: object) -> bool:
+        self._evict()
+        return local_id in self._uploads
+
+    def __iter__(self) -> Iterator[str]:
+        self._evict()
+        return iter(list(self._uploads))
+
+    def __len__(self) -> int:
+        self._evict()
+        return len(self._uploads)
+
+    def values(self) -> List[ZenUpload]:
+        """All kept uploads, in the order they were added."""
+        self._evict()
+        return list(self._uploads.values())
+
+    def with_state(self, state: str) -> List[ZenUpload]:
+        """Kept uploads in a state: active, completed, failed or cancelled."""
+        self._evict()
+        return list(self._states[state].values())
+
+    def count(self, state: str) -> int:
+        """Number of kept uploads in a state."""
+        self._evict()
+        return len(self._states[state])
+
+    @property
+    def active(self) -> List[ZenUpload]:
+        """Uploads not yet finished."""
+        return self.with_state("active")
+
+    @property
+    def completed(self) -> List[ZenUpload]:
+        """Uploads that completed."""
+        return self.with_state("completed")
+
+    @property
+    def failed(self) -> List[ZenUpload]:
+        """Uploads that failed."""
+        return self.with_state("failed")
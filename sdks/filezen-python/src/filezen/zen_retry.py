@@ -0,0 +1,90 @@
+"""Retry policy for the FileZen Python SDK."""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+# Statuses for which the server did not act on the request
+_REFUSED_STATUSES = frozenset({429, 503})
+
+
+@dataclass
+class ZenRetryPolicy:
+    """How ZenApi retries transient failures.
+
+    Delays grow exponentially from ``initial_delay`` up to ``max_delay``, with
+    random jitter so that many clients do not retry in lockstep. A server
+    ``Retry-After`` header is honoured when it asks for a longer wait.
+
+    Idempotent requests (reads, deletes and chunk parts) are retried on any
+    network error or retryable status. Other requests are only retried when the
+    server cannot have acted on them: the connection was never established, or
+    the server refused with 429/503.
+    """
+
+    max_attempts: int = 5
+    initial_delay: float = 0.5
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 1.0
+    max_elapsed: Optional[float] = 300.0
+    retry_statuses: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    def is_retryable(self, error: Exception, idempotent: bool) -> bool:
+        """Check if a failed request may be sent again."""
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status not in self.retry_statuses:
+                return False
+            return idempotent or status in _REFUSED_STATUSES
+        if isinstance(
+            error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+        ):
+            # The request never reached the server
+            return True
+        return idempotent and isinstance(error, httpx.RequestError)
+
+    def next_delay(
+        self, attempt: int, elapsed: float, error: Exception, idempotent: bool
+    ) -> Optional[float]:
+        """Seconds to wait before retrying after ``attempt`` failed attempts.
+
+        Returns None when the request should not be retried.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error, idempotent):
+            return None
+
+        backoff = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1)
+        )
+        delay = backoff * (1 - self.jitter * random.random())
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds requested by a Retry-After header on an error response."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
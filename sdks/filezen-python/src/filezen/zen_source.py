@@ -0,0 +1,377 @@
+"""Upload source readers for the FileZen Python SDK."""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import os
+import re
+import threading
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .types import (
+    ZenBase64Source,
+    ZenBuffer,
+    ZenBytesSource,
+    ZenPathSource,
+    ZenStreamSource,
+    ZenTextSource,
+    ZenUrlSource,
+)
+from .utils import is_base64, is_url, to_memoryview
+
+T = TypeVar("T")
+
+# Buffers up to this size are hashed inline, larger ones off the event loop
+_HASH_INLINE_LIMIT = 64 * 1024
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# Base64 ranges up to this many characters are decoded inline
+_DECODE_INLINE_LIMIT = 64 * 1024
+
+# Marks the end of a sync iterator pulled through the executor
+_EXHAUSTED = object()
+
+
+# Kinds of upload source, as told apart by resolve_source
+SOURCE_KINDS = ("url", "base64", "text", "buffer", "file", "stream")
+
+
+def resolve_source(source: Any) -> Tuple[str, Any]:
+    """Return the kind of an upload source and the value to upload.
+
+    Typed sources are unwrapped without looking at their content. A plain str is
+    sniffed - a URL by its prefix, base64 by its length and a sample at each
+    end - and is text otherwise.
+    """
+    if isinstance(source, ZenUrlSource):
+        return "url", source.url
+    if isinstance(source, ZenBase64Source):
+        return "base64", source.data
+    if isinstance(source, ZenTextSource):
+        return "text", source.text
+    if isinstance(source, ZenBytesSource):
+        return "buffer", source.data
+    if isinstance(source, ZenPathSource):
+        path = source.path
+        return "file", path if isinstance(path, os.PathLike) else Path(path)
+    if isinstance(source, ZenStreamSource):
+        return "stream", source.stream
+
+    if isinstance(source, str):
+        if is_url(source):
+            return "url", source
+        if is_base64(source):
+            return "base64", source
+        return "text", source
+    if is_file_source(source):
+        return "file", source
+    if is_stream_source(source):
+        return "stream", source
+    return "buffer", source
+
+
+def is_buffer_source(source: Any) -> bool:
+    """Check if source supports the buffer protocol."""
+    try:
+        with memoryview(source):
+            return True
+    except TypeError:
+        return False
+
+
+def is_file_source(source: Any) -> bool:
+    """Check if source is a filesystem path or a binary file object.
+
+    Buffers with file methods, such as mmap, are buffers, not files.
+    """
+    if isinstance(source, os.PathLike):
+        return True
+    return (
+        callable(getattr(source, "read", None))
+        and callable(getattr(source, "seek", None))
+        and not is_buffer_source(source)
+    )
+
+
+def is_stream_source(source: Any) -> bool:
+    """Check if source is an async or sync iterable of byte pieces."""
+    if hasattr(source, "__aiter__"):
+        return True
+    if isinstance(source, (str, bytes, bytearray, memoryview)) or is_file_source(
+        source
+    ):
+        return False
+    # Buffers such as mmap or NumPy arrays are iterable too
+    return isinstance(source, Iterable) and not is_buffer_source(source)
+
+
+async def aiter_items(source: Union[AsyncIterable[T], Iterable[T]]) -> AsyncIterator[T]:
+    """Iterate an async or sync iterable, advancing sync iterators off the event loop."""
+    if hasattr(source, "__aiter__"):
+        async for item in cast(AsyncIterable[T], source):
+            yield item
+        return
+
+    loop = asyncio.get_running_loop()
+    iterator: Iterator[T] = iter(cast(Iterable[T], source))
+    while True:
+        next_item = await loop.run_in_executor(None, _next_item, iterator)
+        if next_item is _EXHAUSTED:
+            return
+        yield cast(T, next_item)
+
+
+def _next_item(iterator: Iterator[Any]) -> Any:
+    return next(iterator, _EXHAUSTED)
+
+
+async def iter_chunks(
+    source: Union[AsyncIterable[ZenBuffer], Iterable[ZenBuffer]],
+    chunk_size: Union[int, Callable[[], int]],
+) -> AsyncIterator[ZenBuffer]:
+    """Re-chunk a stream of arbitrarily sized pieces into fixed-size parts.
+
+    ``chunk_size`` may be a callable, consulted at the start of every chunk. At
+    most one partial chunk is buffered; the last part may be shorter.
+    """
+    size_of_chunk = chunk_size if callable(chunk_size) else lambda: chunk_size
+    target = size_of_chunk()
+    buffer = bytearray()
+    async for piece in aiter_items(source):
+        view = to_memoryview(piece)
+        offset = 0
+        while offset < view.nbytes:
+            take = min(target - len(buffer), view.nbytes - offset)
+            buffer += view[offset : offset + take]
+            offset += take
+            if len(buffer) >= target:
+                chunk, buffer = buffer, bytearray()
+                target = size_of_chunk()
+                yield chunk
+    if buffer:
+        yield buffer
+
+
+def file_source_name(source: Any) -> Optional[str]:
+    """Return the base name of a path or file object source, if it has one."""
+    name = source if isinstance(source, os.PathLike) else getattr(source, "name", None)
+    if isinstance(name, (str, os.PathLike)):
+        return os.path.basename(os.fspath(name)) or None
+    return None
+
+
+class FileReader:
+    """Reads byte ranges of a file source off the event loop.
+
+    Ranges are read with ``os.pread`` where the platform and file object allow
+    it, so concurrent chunk reads never share a file position. Other file objects
+    fall back to ``seek`` + ``read`` under a lock. Only the requested range is
+    ever held in memory.
+    """
+
+    def __init__(self, file: BinaryIO, *, owns_file: bool) -> None:
+        self._file = file
+        self._owns_file = owns_file
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+
+        # File objects are uploaded from their current position to the end
+        self._offset = file.tell()
+        try:
+            fd = file.fileno()
+            end = os.fstat(fd).st_size
+            if hasattr(os, "pread"):
+                self._fd = fd
+        except (AttributeError, OSError, ValueError):
+            end = file.seek(0, os.SEEK_END)
+            file.seek(self._offset)
+        self.size = max(0, end - self._offset)
+
+    @classmethod
+    async def open(cls, source: Union["os.PathLike[str]", BinaryIO]) -> "FileReader":
+        """Open a reader for a path or an already open binary file object."""
+        loop = asyncio.get_running_loop()
+        if isinstance(source, os.PathLike):
+            file = await loop.run_in_executor(None, open, os.fspath(source), "rb")
+            return cls(cast(BinaryIO, file), owns_file=True)
+        return cls(source, owns_file=False)
+
+    async def read(self, start: int, end: int) -> bytes:
+        """Read bytes ``[start, end)`` relative to the start of the source."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_range, start, end)
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        size = end - start
+        offset = self._offset + start
+        if self._fd is not None:
+            data = os.pread(self._fd, size, offset)
+            if len(data) == size:
+                return data
+            # Short read - keep reading until the range is complete
+            parts = [data]
+            read = len(data)
+            while read < size:
+                part = os.pread(self._fd, size - read, offset + read)
+                if not part:
+                    break
+                parts.append(part)
+                read += len(part)
+            return b"".join(parts)
+
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def close(self) -> None:
+        """Close the underlying file if this reader opened it."""
+        if self._owns_file:
+            self._file.close()
+
+
+class Base64Reader:
+    """Decodes byte ranges of a base64 string or data URL on demand.
+
+    The decoded size is known from the encoded length, so a base64 source can be
+    sent like a sized file: each range is decoded from the 4-character groups
+    that cover it, and the string is never decoded, or copied, as a whole.
+    """
+
+    def __init__(self, source: str) -> None:
+        """Initialize Base64Reader.
+
+        Raises:
+            ValueError: The source is not padded base64
+        """
+        self._source = source
+        self.mime_type: Optional[str] = None
+        self._start = 0
+        if source.startswith("data:"):
+            comma = source.find(",")
+            if comma < 0:
+                raise ValueError("Data URL has no data")
+            # Extract MIME type from data URL
+            mime_match = re.match(r"data:([^;,]+)", source[:comma])
+            if mime_match:
+                self.mime_type = mime_match.group(1)
+            self._start = comma + 1
+
+        length = len(source) - self._start
+        if length % 4:
+            raise ValueError("Base64 data length is not a multiple of 4")
+        padding = 0
+        while padding < min(2, length) and source[-1 - padding] == "=":
+            padding += 1
+        self.size = length // 4 * 3 - padding
+
+    async def read(self, start: int, end: int) -> ZenBuffer:
+        """Decode bytes ``[start, end)`` of the decoded content."""
+        if end - start <= _DECODE_INLINE_LIMIT:
+            return self._read_range(start, end)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_range, start, end)
+
+    def _read_range(self, start: int, end: int) -> ZenBuffer:
+        # Every 4 characters decode to 3 bytes; decode the groups covering the range
+        first_group = start // 3
+        last_group = -(-end // 3)
+        encoded = self._source[
+            self._start + first_group * 4 : self._start + last_group * 4
+        ]
+        try:
+            data = base64.b64decode(encoded, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Invalid base64 data: {e}") from e
+        skip = start - first_group * 3
+        # A view, so trimming to the range does not copy it
+        return memoryview(data)[skip : skip + end - start]
+
+
+async def source_identity(source: Any) -> Optional[str]:
+    """Return a string that identifies the content of a source across restarts.
+
+    Files are identified by their location, size and modification time; buffers
+    by a SHA-256 of their content, hashed off the event loop. Streams, URLs and
+    other strings have no stable identity and return None.
+    """
+    if isinstance(source, os.PathLike) or (
+        is_file_source(source) and hasattr(source, "fileno")
+    ):
+        try:
+            if isinstance(source, os.PathLike):
+                path = os.path.realpath(os.fspath(source))
+                stat = os.stat(path)
+            else:
+                path = os.path.realpath(os.fspath(source.name))
+                stat = os.fstat(source.fileno())
+                path = f"{path}@{source.tell()}"
+        except (AttributeError, OSError, TypeError, ValueError):
+            return None
+        return f"file:{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    if isinstance(source, str) or is_file_source(source) or is_stream_source(source):
+        return None
+
+    return await content_digest(source)
+
+
+async def content_digest(source: Any) -> Optional[str]:
+    """Return a SHA-256 of the bytes a source uploads, as ``sha256:<hex>``.
+
+    Strings are hashed as UTF-8. Buffers of more than 64KB, files and file
+    objects are hashed off the event loop; file objects are returned to their
+    position afterwards. Streams cannot be hashed without consuming them and
+    return None.
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    elif is_stream_source(source):
+        return None
+
+    loop = asyncio.get_running_loop()
+    if is_file_source(source):
+        digest = await loop.run_in_executor(None, _hash_file, source)
+    else:
+        view = to_memoryview(source)
+        if view.nbytes <= _HASH_INLINE_LIMIT:
+            digest = hashlib.sha256(view).hexdigest()
+        else:
+            digest = await loop.run_in_executor(None, _hash_buffer, view)
+    return f"sha256:{digest}"
+
+
+def _hash_buffer(view: memoryview) -> str:
+    return hashlib.sha256(view).hexdigest()
+
+
+def _hash_file(source: Union["os.PathLike[str]", BinaryIO]) -> str:
+    digest = hashlib.sha256()
+    if isinstance(source, os.PathLike):
+        with open(os.fspath(source), "rb") as f:
+            for block in iter(partial(f.read, _HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    position = source.tell()
+    try:
+        for block in iter(partial(source.read, _HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    finally:
+        source.seek(position)
+    return digest.hexdigest()
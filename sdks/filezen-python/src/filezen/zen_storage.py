@@ -1,31 +1,76 @@
 """Main storage class for the FileZen Python SDK."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union, cast
+import asyncio
+import mimetypes
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+import httpx
 
+from .constants import (
+    BULK_UPLOAD_CONCURRENCY,
+    FILES_PAGE_SIZE,
+    FILES_PREFETCH,
+    LISTENER_QUEUE_SIZE,
+    PROGRESS_INTERVAL,
+)
 from .types import (
     FinishMultipartUploadParams,
     MultipartChunkUploadResult,
     MultipartUploadChunkParams,
     StartMultipartUploadParams,
     ZenFile,
+    ZenList,
+    ZenProgress,
     ZenStorageBulkItem,
     ZenStorageUploadOptions,
     ZenUploadSource,
     to_dataclass,
 )
+from .utils import to_memoryview
 from .zen_api import ZenApi
+from .zen_budget import ByteBudget
+from .zen_checkpoint import ZenUploadCheckpoint
+from .zen_chunk_sizer import ZenChunkSizer
+from .zen_compression import new_compressor
+from .zen_dedup import (
+    Deduplicator,
+    ZenDedupIndex,
+    ZenMemoryDedupIndex,
+    ZenSQLiteDedupIndex,
+)
 from .zen_error import ZenError
+from .zen_events import ListenerDispatcher
+from .zen_journal import ZenUploadJournal
+from .zen_queue import UploadQueue, ZenUploadPriority
+from .zen_registry import ZenUploadRegistry
+from .zen_retry import ZenRetryPolicy
+from .zen_source import aiter_items, file_source_name, resolve_source
 from .zen_upload import ZenUpload
 
 
 @dataclass
-class ZenProgress:
-    """Progress information for uploads."""
+class ZenBulkUploadSummary:
+    """Outcome of a bulk upload that does not stop at the first failure."""
 
-    bytes: Optional[int] = None
-    total: Optional[int] = None
-    percent: Optional[float] = None
+    completed: List[ZenUpload] = field(default_factory=list)
+    failed: List[ZenUpload] = field(default_factory=list)
 
 
 class ZenUploadListener:
@@ -64,7 +109,7 @@ class ZenMultipartControl:
 
     async def start(
         self,
-        params: Union[StartMultipartUploadParams, Dict[str, Any]] = None,
+        params: Optional[Union[StartMultipartUploadParams, Dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> Dict[str, str]:
         """Start a multipart upload session.
@@ -104,6 +149,8 @@ class ZenMultipartControl:
             ]:
                 if key in params:
                     api_params[api_key] = params[key]
+        elif params is None:
+            raise ZenError("No multipart upload parameters given")
         else:
             # StartMultipartUploadParams object
             api_params = {
@@ -135,7 +182,7 @@ class ZenMultipartControl:
 
     async def upload_part(
         self,
-        params: Union[MultipartUploadChunkParams, Dict[str, Any]] = None,
+        params: Optional[Union[MultipartUploadChunkParams, Dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> MultipartChunkUploadResult:
         """Upload a part of the multipart upload.
@@ -153,13 +200,18 @@ class ZenMultipartControl:
             session_id = params["session_id"]
             chunk = params["chunk"]
             chunk_index = params.get("chunk_index", 0)
+        elif params is None:
+            raise ZenError("No multipart upload parameters given")
         else:
             # MultipartUploadChunkParams object
             session_id = params.session_id
             chunk = params.chunk
             chunk_index = params.chunk_index or 0
 
-        result = await self.api.upload_chunk(session_id, chunk, chunk_index, len(chunk))
+        chunk = to_memoryview(chunk)
+        result = await self.api.upload_chunk(
+            session_id, chunk, chunk_index, chunk.nbytes
+        )
 
         if result.error:
             raise ZenError(result.error.get("message", "Failed to upload chunk"))
@@ -172,7 +224,9 @@ class ZenMultipartControl:
 
     async def finish(
         self,
-        params: Union[FinishMultipartUploadParams, Dict[str, Any], str] = None,
+        params: Optional[
+            Union[FinishMultipartUploadParams, Dict[str, Any], str]
+        ] = None,
         **kwargs: Any,
     ) -> ZenFile:
         """Finish the multipart upload.
@@ -188,6 +242,8 @@ class ZenMultipartControl:
             session_id = params
         elif isinstance(params, dict):
             session_id = params["session_id"]
+        elif params is None:
+            raise ZenError("No multipart upload parameters given")
         else:
             # FinishMultipartUploadParams object
             session_id = params.session_id
@@ -205,6 +261,25 @@ class ZenStorage:
         api_key: Optional[str] = None,
         api_url: Optional[str] = None,
         keep_uploads: bool = False,
+        journal: Optional[Union[str, "os.PathLike[str]", ZenUploadJournal]] = None,
+        adaptive_chunking: Union[bool, ZenChunkSizer] = False,
+        retry: Optional[ZenRetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        queue_workers: int = 4,
+        queue_limits: Optional[Dict[int, int]] = None,
+        progress_interval: float = PROGRESS_INTERVAL,
+        background_listeners: bool = False,
+        listener_queue_size: int = LISTENER_QUEUE_SIZE,
+        max_kept_uploads: Optional[int] = None,
+        kept_upload_ttl: Optional[float] = None,
+        dedup: Union[bool, str, "os.PathLike[str]", ZenDedupIndex] = False,
+        checksums: bool = True,
+        compression: Optional[str] = None,
+        raw_uploads: bool = False,
     ):
         """Initialize ZenStorage.
 
@@ -212,6 +287,49 @@ class ZenStorage:
             api_key: FileZen API key. If not provided, will use FILEZEN_API_KEY environment variable.
             api_url: Custom API URL. Defaults to https://api.filezen.dev
             keep_uploads: Whether to keep upload records in memory for tracking. Defaults to False.
+            max_kept_uploads: With keep_uploads, most uploads to keep; the least
+                recently used finished uploads are dropped first.
+            kept_upload_ttl: With keep_uploads, seconds a finished upload is kept
+                after it finished or was last looked up.
+            journal: Upload journal, or a directory for one, that records multipart
+                sessions so uploads with ``resume=True`` continue after a restart.
+            adaptive_chunking: Size multipart chunks from measured throughput instead
+                of the fixed 10MB. Pass a ZenChunkSizer to tune its bounds.
+            retry: Retry policy for transient API failures. Defaults to ZenRetryPolicy().
+            max_connections: Maximum number of open connections. None for no limit.
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Multiplex requests over HTTP/2. Requires the ``http2`` extra.
+            transport: httpx transport shared with other storages. Its connection
+                pool is used instead of a private one and is not closed by close().
+            queue_workers: Most uploads started by enqueue() running at once.
+            queue_limits: Most queued uploads of each ZenUploadPriority running at
+                once. Defaults to LOW using at most half the workers, so
+                interactive uploads find a free worker behind a backfill.
+            progress_interval: Least seconds between on_upload_progress events for
+                one upload. Updates in between are coalesced into the next event.
+            background_listeners: Deliver listener events from a background task
+                instead of inline, so slow listeners never stall uploads.
+                ``async def`` callbacks are awaited; others run on a listener
+                thread. Bursts of on_uploads_change are coalesced.
+            listener_queue_size: With background_listeners, progress events are
+                dropped while this many events are waiting to be delivered.
+            dedup: Skip uploading content already uploaded with the same name,
+                destination and metadata, returning the earlier file instead.
+                Concurrent identical uploads send the content once. Pass True
+                for an in-memory index, a file for a ZenSQLiteDedupIndex that
+                persists it and is closed with the storage, or any
+                ZenDedupIndex, which is left open.
+            checksums: Send a SHA-256 with each multipart chunk, hashed off the
+                event loop while earlier chunks are sent. A chunk the server
+                received with a different digest is sent again on its own.
+            compression: Compress text and compressible uploads, "gzip" or
+                "zstd" (requires the ``zstd`` extra). Uploads whose MIME type or
+                sampled content does not compress well are sent as is. The
+                encoding is recorded in the file's metadata as ``contentEncoding``.
+            raw_uploads: Send content as a raw ``application/octet-stream`` body
+                with the upload parameters in headers, instead of as
+                ``multipart/form-data``. Requires an API that accepts raw uploads.
 
         Examples:
             # ✅ RECOMMENDED: Direct parameters with full IDE support
@@ -222,12 +340,68 @@ class ZenStorage:
 
             # ✅ MINIMAL: Just what you need
             storage = ZenStorage(api_key="your_key")
+
+            # ✅ SHARED POOL: Many storages reusing warm connections
+            transport = httpx.AsyncHTTPTransport(http2=True)
+            storage_a = ZenStorage(api_key="key_a", transport=transport)
+            storage_b = ZenStorage(api_key="key_b", transport=transport)
         """
         # Initialize ZenApi with direct parameters
-        self.api = ZenApi(api_key=api_key, api_url=api_url)
+        self.api = ZenApi(
+            api_key=api_key,
+            api_url=api_url,
+            retry=retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            transport=transport,
+            raw_uploads=raw_uploads,
+        )
         self._keep_uploads = keep_uploads
+        self.journal = (
+            journal
+            if journal is None or isinstance(journal, ZenUploadJournal)
+            else ZenUploadJournal(journal)
+        )
+        self.chunk_sizer = (
+            adaptive_chunking
+            if isinstance(adaptive_chunking, ZenChunkSizer)
+            else ZenChunkSizer() if adaptive_chunking else None
+        )
+        # An index opened from a path is the storage's to close
+        self._dedup_db: Optional[ZenSQLiteDedupIndex] = None
+        dedup_index: Optional[ZenDedupIndex] = None
+        if isinstance(dedup, ZenDedupIndex):
+            dedup_index = dedup
+        elif isinstance(dedup, (str, os.PathLike)):
+            dedup_index = self._dedup_db = ZenSQLiteDedupIndex(dedup)
+        elif dedup:
+            dedup_index = ZenMemoryDedupIndex()
+        self.dedup = Deduplicator(dedup_index) if dedup_index else None
+        self.checksums = checksums
+        if compression:
+            new_compressor(compression)  # Fail fast on an unusable encoding
+        self.compression = compression
+        self.progress_interval = progress_interval
         self.listeners: List[ZenUploadListener] = []
-        self.uploads: Dict[str, ZenUpload] = {}
+        self.uploads = ZenUploadRegistry(max_size=max_kept_uploads, ttl=kept_upload_ttl)
+        self._dispatcher = (
+            ListenerDispatcher(
+                self.listeners, lambda: self.get_uploads, listener_queue_size
+            )
+            if background_listeners
+            else None
+        )
+        self.queue = UploadQueue(
+            self._run_queued,
+            workers=queue_workers,
+            class_limits=(
+                queue_limits
+                if queue_limits is not None
+                else {ZenUploadPriority.LOW: max(1, queue_workers // 2)}
+            ),
+        )
 
     @property
     def multipart(self) -> ZenMultipartControl:
@@ -254,16 +428,22 @@ class ZenStorage:
     @property
     def get_uploads(self) -> List[ZenUpload]:
         """Get all uploads."""
-        return list(self.uploads.values())
+        return self.uploads.values()
 
     @property
     def active_uploads(self) -> List[ZenUpload]:
         """Get active uploads."""
-        return [
-            upload
-            for upload in self.uploads.values()
-            if not upload.error and not upload.is_completed
-        ]
+        return self.uploads.active
+
+    @property
+    def completed_uploads(self) -> List[ZenUpload]:
+        """Get completed uploads."""
+        return self.uploads.completed
+
+    @property
+    def failed_uploads(self) -> List[ZenUpload]:
+        """Get failed uploads."""
+        return self.uploads.failed
 
     def _notify_listeners(self, event: str, *args: Any) -> None:
         """Notify all listeners of an event.
@@ -272,6 +452,10 @@ class ZenStorage:
             event: Event name
             args: Event arguments
         """
+        if self._dispatcher:
+            self._dispatcher.emit(event, *args)
+            return
+
         for listener in self.listeners:
             callback = getattr(listener, event, None)
             if callback:
@@ -281,6 +465,9 @@ class ZenStorage:
                     # Log error but don't break the upload process
                     print(f"Error in listener {event}: {e}")
 
+    def _on_upload_progress(self, upload: ZenUpload, progress: ZenProgress) -> None:
+        self._notify_listeners("on_upload_progress", upload, progress)
+
     def build_upload(
         self,
         source: ZenUploadSource,
@@ -289,7 +476,8 @@ class ZenStorage:
         """Build an upload object without starting it.
 
         Args:
-            source: File source (bytes, string URL, base64, or text)
+            source: File source (bytes-like buffer, path, file object, string URL, base64, text,
+                or a typed source such as ZenTextSource that skips sniffing strings)
             options: Upload options as dict or ZenStorageUploadOptions
 
         Returns:
@@ -311,13 +499,17 @@ class ZenStorage:
             })
         """
         # Convert options to dataclass if needed
-        options = to_dataclass(ZenStorageUploadOptions, options)
+        options = to_dataclass(ZenStorageUploadOptions, options or {})
         options = cast(ZenStorageUploadOptions, options)
 
         # Determine file name and MIME type
-        name = options.name if options.name else "file"
+        kind, payload = resolve_source(source)
+        source_name = file_source_name(payload) if kind == "file" else None
+        name = options.name or source_name or "file"
         mime_type = (
-            options.mime_type if options.mime_type else "application/octet-stream"
+            options.mime_type
+            or (source_name and mimetypes.guess_type(source_name)[0])
+            or "application/octet-stream"
         )
 
         # Create upload instance
@@ -325,17 +517,32 @@ class ZenStorage:
             name=name,
             mime_type=mime_type,
             api=self.api,
-            source=source,
+            source=payload,
+            source_kind=kind,
             folder=options.folder,
             metadata=options.metadata,
             project_id=options.project_id,
             folder_id=options.folder_id,
+            multipart_concurrency=options.multipart_concurrency,
+            journal=self.journal,
+            resume=options.resume,
+            chunk_sizer=self.chunk_sizer,
+            dedup=self.dedup,
+            checksums=self.checksums,
+            compression=self.compression,
+            on_progress=self._on_upload_progress,
+            progress_interval=self.progress_interval,
+            on_state_change=self.uploads.update if self._keep_uploads else None,
         )
 
         # Store upload if tracking is enabled
         if self._keep_uploads:
-            self.uploads[upload.local_id] = upload
-            self._notify_listeners("on_uploads_change", self.get_uploads)
+            self.uploads.add(upload)
+            if self._dispatcher:
+                # The uploads list is taken when the coalesced event is delivered
+                self._dispatcher.emit("on_uploads_change")
+            else:
+                self._notify_listeners("on_uploads_change", self.get_uploads)
 
         return upload
 
@@ -348,7 +555,8 @@ class ZenStorage:
         """Upload a file to FileZen.
 
         Args:
-            source: File source (bytes, string URL, base64, or text)
+            source: File source (bytes-like buffer, path, file object, string URL, base64, text,
+                or a typed source such as ZenTextSource that skips sniffing strings)
             options: Upload options as dict or ZenStorageUploadOptions
             **kwargs: Additional options as keyword arguments
 
@@ -399,16 +607,91 @@ class ZenStorage:
 
         return upload
 
+    def _build_bulk_uploads(
+        self, items: Sequence[Union[Dict[str, Any], ZenStorageBulkItem]]
+    ) -> List[ZenUpload]:
+        """Build uploads for bulk items given as dicts or ZenStorageBulkItem."""
+        upload_objects = []
+        for item in items:
+            if isinstance(item, dict):
+                item = ZenStorageBulkItem.from_dict(item)
+            upload_objects.append(self.build_upload(item.source, item.options))
+        return upload_objects
+
+    async def _run_upload(
+        self, upload: ZenUpload, budget: Optional[ByteBudget] = None
+    ) -> ZenUpload:
+        """Run an upload and notify listeners of its outcome without raising.
+
+        With a budget, the upload first waits for its share of in-flight bytes.
+        """
+        if budget is not None:
+            async with budget.reserve(upload.inflight_bytes()):
+                return await self._run_upload(upload)
+
+        self._notify_listeners("on_upload_start", upload)
+        try:
+            await upload.upload()
+        except Exception as e:
+            self._notify_listeners("on_upload_error", upload, upload.error or e)
+        else:
+            self._notify_listeners("on_upload_complete", upload)
+        return upload
+
+    async def _run_bulk(
+        self,
+        upload_objects: List[ZenUpload],
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+    ) -> AsyncIterator[ZenUpload]:
+        """Run uploads with bounded concurrency, yielding each as it finishes.
+
+        Failed uploads are yielded with ``error`` set. Uploads still pending when
+        the iterator is closed early are cancelled.
+        """
+        # Uploads wait for a free slot and for their share of the byte budget
+        slots = asyncio.Semaphore(max(1, max_concurrency or BULK_UPLOAD_CONCURRENCY))
+        budget = ByteBudget(max_inflight_bytes) if max_inflight_bytes else None
+
+        async def run(upload: ZenUpload) -> ZenUpload:
+            async with slots:
+                return await self._run_upload(upload, budget)
+
+        tasks = {
+            asyncio.ensure_future(run(upload)): upload for upload in upload_objects
+        }
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task, upload in tasks.items():
+                if not task.done():
+                    task.cancel()
+                    upload.cancel()
+                    self._notify_listeners("on_upload_cancel", upload)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def bulk_upload(
-        self, *uploads: Union[Dict[str, Any], ZenStorageBulkItem]
+        self,
+        *uploads: Union[Dict[str, Any], ZenStorageBulkItem],
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
     ) -> List[ZenUpload]:
         """Upload multiple files in parallel.
 
+        Every upload runs to completion. If any failed, the error of the first
+        failed item is raised afterwards; use bulk_upload_summary() or
+        iter_bulk_upload() to keep the uploads that succeeded.
+
         Args:
             *uploads: Upload items as dicts or ZenStorageBulkItem instances
+            max_concurrency: Most uploads running at once. Defaults to 16.
+            max_inflight_bytes: Most bytes held in memory by running uploads. A
+                multipart upload counts one chunk per concurrent part; an upload
+                larger than the budget runs on its own. Unlimited by default.
 
         Returns:
-            List of completed uploads
+            List of completed uploads, in the order given
 
         Examples:
             # ✅ RECOMMENDED: Using dataclasses for full IDE support
@@ -429,54 +712,234 @@ class ZenStorage:
                 {"source": file1_bytes, "options": {"name": "file1.txt"}},
                 {"source": file2_bytes, "options": {"name": "file2.txt"}}
             )
+
+            # ✅ THROTTLED: Large batches at a steady pace
+            uploads = await storage.bulk_upload(
+                *items, max_concurrency=8, max_inflight_bytes=256 * 1024 * 1024
+            )
         """
-        # Convert dicts to dataclasses if needed
-        bulk_items = []
-        for item in uploads:
-            if isinstance(item, dict):
-                bulk_items.append(ZenStorageBulkItem.from_dict(item))
-            else:
-                bulk_items.append(item)
+        summary = await self.bulk_upload_summary(
+            *uploads,
+            max_concurrency=max_concurrency,
+            max_inflight_bytes=max_inflight_bytes,
+        )
+        if summary.failed:
+            raise cast(ZenError, summary.failed[0].error)
+        return summary.completed
 
-        # Create uploads
-        upload_objects = []
-        for item in bulk_items:
-            upload = self.build_upload(item.source, item.options)
-            upload_objects.append(upload)
+    async def bulk_upload_summary(
+        self,
+        *uploads: Union[Dict[str, Any], ZenStorageBulkItem],
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+    ) -> ZenBulkUploadSummary:
+        """Upload multiple files in parallel, collecting failures instead of raising.
 
-        # Notify listeners
-        for upload in upload_objects:
-            self._notify_listeners("on_upload_start", upload)
+        Takes the same arguments as bulk_upload().
 
-        # Execute uploads in parallel
-        import asyncio
+        Returns:
+            Completed and failed uploads, each in the order given
 
-        try:
-            results = await asyncio.gather(
-                *[upload.upload() for upload in upload_objects], return_exceptions=True
-            )
+        Examples:
+            summary = await storage.bulk_upload_summary(*items)
+            for upload in summary.failed:
+                print(f"{upload.name}: {upload.error}")
+        """
+        upload_objects = self._build_bulk_uploads(uploads)
+        async for _ in self._run_bulk(
+            upload_objects, max_concurrency, max_inflight_bytes
+        ):
+            pass
+
+        return ZenBulkUploadSummary(
+            completed=[u for u in upload_objects if u.is_completed],
+            failed=[u for u in upload_objects if u.error],
+        )
 
-            # Handle results
-            completed_uploads = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    # Notify error
-                    self._notify_listeners("on_upload_error", upload_objects[i], result)
-                    raise result
+    def iter_bulk_upload(
+        self,
+        *uploads: Union[Dict[str, Any], ZenStorageBulkItem],
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+    ) -> AsyncIterator[ZenUpload]:
+        """Upload multiple files in parallel, yielding each as it finishes.
+
+        Takes the same arguments as bulk_upload(). Failed uploads are yielded with
+        ``error`` set rather than raised. Leaving the loop early cancels the
+        uploads that have not finished.
+
+        Examples:
+            async for upload in storage.iter_bulk_upload(*items):
+                if upload.error:
+                    print(f"{upload.name} failed: {upload.error}")
                 else:
-                    # Notify completion
-                    self._notify_listeners("on_upload_complete", result)
-                    completed_uploads.append(result)
+                    await index(upload.file)
+        """
+        return self._run_bulk(
+            self._build_bulk_uploads(uploads), max_concurrency, max_inflight_bytes
+        )
+
+    def enqueue(
+        self,
+        source: ZenUploadSource,
+        options: Optional[Union[Dict[str, Any], ZenStorageUploadOptions]] = None,
+        *,
+        priority: int = ZenUploadPriority.NORMAL,
+        **kwargs: Any,
+    ) -> "asyncio.Future[ZenUpload]":
+        """Queue an upload to run in the background.
 
-            # Filter out exceptions from the result list for correct return type
-            return [u for u in completed_uploads if isinstance(u, ZenUpload)]
+        Queued uploads run on a pool of ``queue_workers``, highest priority first
+        and, within a priority, in the order queued.
 
-        except Exception as e:
-            # Notify errors for all uploads
-            for upload in upload_objects:
-                self._notify_listeners("on_upload_error", upload, e)
+        Args:
+            source: File source (bytes-like buffer, path, file object, string URL, base64, text,
+                or a typed source such as ZenTextSource that skips sniffing strings)
+            options: Upload options as dict or ZenStorageUploadOptions
+            priority: ZenUploadPriority of the upload
+            **kwargs: Additional options as keyword arguments
+
+        Returns:
+            A future resolving to the completed upload, or raising its ZenError.
+            Cancelling the future cancels the upload.
+
+        Examples:
+            # Backfill traffic never delays interactive uploads
+            for path in backfill_paths:
+                storage.enqueue(path, priority=ZenUploadPriority.LOW)
+
+            upload = await storage.enqueue(
+                avatar_bytes, name="avatar.png", priority=ZenUploadPriority.HIGH
+            )
+        """
+        if kwargs and options is None:
+            options = kwargs
+        elif kwargs and isinstance(options, dict):
+            options.update(kwargs)
+
+        upload = self.build_upload(source, options)
+        return self.queue.put(upload, priority)
+
+    async def _run_queued(self, upload: ZenUpload) -> ZenUpload:
+        """Run a queued upload, notifying listeners if it is cancelled."""
+        try:
+            return await self._run_upload(upload)
+        except asyncio.CancelledError:
+            upload.cancel()
+            self._notify_listeners("on_upload_cancel", upload)
             raise
 
+    async def upload_stream(
+        self,
+        items: Union[
+            AsyncIterable[Union[Dict[str, Any], ZenStorageBulkItem]],
+            Iterable[Union[Dict[str, Any], ZenStorageBulkItem]],
+        ],
+        *,
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+        checkpoint: Optional[
+            Union[str, "os.PathLike[str]", ZenUploadCheckpoint]
+        ] = None,
+    ) -> AsyncIterator[ZenUpload]:
+        """Upload items pulled lazily from an iterable, yielding each as it finishes.
+
+        Items are read only as workers free up, so a manifest of any length is
+        never held in memory. Sync iterables are advanced off the event loop.
+        Failed uploads are yielded with ``error`` set. Leaving the loop early
+        cancels the uploads in flight.
+
+        Args:
+            items: Upload items as dicts or ZenStorageBulkItem instances
+            max_concurrency: Most uploads running at once. Defaults to 16.
+            max_inflight_bytes: Most bytes held in memory by running uploads.
+            checkpoint: Checkpoint, or a file for one, recording the ``key`` of
+                every completed item. Items whose key is already recorded are
+                skipped, so a restarted job continues where it stopped. Keys are
+                compared as strings. Items without a key are always uploaded.
+
+        Examples:
+            def manifest():
+                with open("manifest.jsonl") as f:
+                    for line in f:
+                        row = json.loads(line)
+                        yield {"key": row["id"], "source": pathlib.Path(row["path"])}
+
+            async for upload in storage.upload_stream(
+                manifest(), max_concurrency=32, checkpoint="backfill.checkpoint"
+            ):
+                if upload.error:
+                    print(f"{upload.name} failed: {upload.error}")
+        """
+        if checkpoint is not None and not isinstance(checkpoint, ZenUploadCheckpoint):
+            checkpoint = ZenUploadCheckpoint(checkpoint)
+
+        workers = max(1, max_concurrency or BULK_UPLOAD_CONCURRENCY)
+        budget = ByteBudget(max_inflight_bytes) if max_inflight_bytes else None
+        pending_items = aiter_items(items)
+        pull_lock = asyncio.Lock()
+        running: Set[ZenUpload] = set()
+        # Workers block once the caller falls this far behind
+        results: asyncio.Queue[Union[ZenUpload, Exception, None]] = asyncio.Queue(
+            maxsize=workers
+        )
+
+        async def next_item() -> Optional[ZenStorageBulkItem]:
+            async with pull_lock:
+                async for item in pending_items:
+                    if isinstance(item, dict):
+                        item = ZenStorageBulkItem.from_dict(item)
+                    if (
+                        checkpoint is None
+                        or item.key is None
+                        or item.key not in checkpoint
+                    ):
+                        return item
+                return None
+
+        async def work() -> None:
+            try:
+                while True:
+                    item = await next_item()
+                    if item is None:
+                        break
+                    upload = self.build_upload(item.source, item.options)
+                    running.add(upload)
+                    await self._run_upload(upload, budget)
+                    running.discard(upload)
+                    if (
+                        checkpoint is not None
+                        and item.key is not None
+                        and upload.is_completed
+                    ):
+                        await checkpoint.record(item.key)
+                    await results.put(upload)
+            except Exception as e:
+                # Reading the items failed - stop the whole stream
+                await results.put(e)
+            await results.put(None)
+
+        tasks = [asyncio.ensure_future(work()) for _ in range(workers)]
+        try:
+            finished = 0
+            while finished < workers:
+                result = await results.get()
+                if result is None:
+                    finished += 1
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            for upload in running:
+                upload.cancel()
+                self._notify_listeners("on_upload_cancel", upload)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if checkpoint is not None:
+                await checkpoint.flush()
+
     def generate_signed_url(self, options: Dict[str, Any]) -> str:
         """Generate a signed URL for direct file access.
 
@@ -506,11 +969,150 @@ class ZenStorage:
             # Delete a file by URL
             success = await storage.delete_by_url("https://api.filezen.dev/files/123")
         """
-        return await self.api.delete_file_by_url(url)
+        deleted = await self.api.delete_file_by_url(url)
+        if self.dedup:
+            await self.dedup.index.discard(url=url)
+        return deleted
+
+    async def list_files(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> ZenList:
+        """List files.
+
+        Args:
+            limit: Number of files to return (default: 20)
+            offset: Number of files to skip (default: 0)
+            cursor: ``next_cursor`` of the previous page, instead of an offset
+
+        Returns:
+            A page of files
+        """
+        return await self.api.list_files(limit=limit, offset=offset, cursor=cursor)
+
+    async def iter_files(
+        self, *, page_size: int = FILES_PAGE_SIZE, prefetch: int = FILES_PREFETCH
+    ) -> AsyncIterator[ZenFile]:
+        """Iterate over every file, fetching pages ahead of the caller.
+
+        With offset paging, up to ``prefetch`` pages are requested at once, so a
+        full scan runs at network speed rather than one round trip per page. If
+        the API returns a ``next_cursor``, pages are chained by cursor instead,
+        and the next page is fetched while the current one is consumed. At most
+        ``prefetch`` pages are buffered; leaving the loop cancels the requests
+        still pending.
+
+        Offsets advance by the files each page returned, so a server that caps
+        the page size below ``page_size`` is paged through to the end. Paging
+        stops at the listing's total, or, if the API reports none, at the first
+        short page.
+
+        Args:
+            page_size: Files requested per page
+            prefetch: Most pages requested or buffered ahead of the caller
+
+        Examples:
+            async for file in storage.iter_files(page_size=500):
+                print(file.name)
+        """
+        page_size = max(1, page_size)
+        prefetch = max(1, prefetch)
+        # Requested pages, with the offset each was requested at
+        pages: Deque[Tuple[int, asyncio.Future[ZenList]]] = deque()
+
+        async def drop_pages() -> None:
+            dropped = [future for _, future in pages]
+            pages.clear()
+            for future in dropped:
+                future.cancel()
+            await asyncio.gather(*dropped, return_exceptions=True)
+
+        try:
+            page = await self.api.list_files(limit=page_size, offset=0)
+            if page.next_cursor is not None:
+                # Keyset paging - each page names the next one
+                while True:
+                    cursor = page.next_cursor
+                    if cursor is not None and page.data:
+                        pages.append(
+                            (
+                                0,
+                                asyncio.ensure_future(
+                                    self.api.list_files(limit=page_size, cursor=cursor)
+                                ),
+                            )
+                        )
+                    for file in page.data:
+                        yield file
+                    if not pages:
+                        return
+                    page = await pages.popleft()[1]
+
+            # Offset paging - request the following pages side by side
+            total = page.total
+            limit = page_size
+            if 0 < len(page.data) < min(page_size, total):
+                # The server caps pages below the size asked for
+                limit = len(page.data)
+            offset = 0
+            next_offset = len(page.data)
+            while True:
+                end = offset + len(page.data)
+                if total:
+                    last = not page.data or end >= total
+                else:
+                    # Without a total, only a short page marks the end
+                    last = len(page.data) < limit
+                if last:
+                    await drop_pages()
+                else:
+                    if pages and pages[0][0] != end:
+                        # A page came back short - continue from where it ended
+                        await drop_pages()
+                        next_offset = end
+                    while len(pages) < prefetch and (not total or next_offset < total):
+                        pages.append(
+                            (
+                                next_offset,
+                                asyncio.ensure_future(
+                                    self.api.list_files(limit=limit, offset=next_offset)
+                                ),
+                            )
+                        )
+                        next_offset += limit
+                for file in page.data:
+                    yield file
+                if not pages:
+                    return
+                offset, future = pages.popleft()
+                page = await future
+        finally:
+            await drop_pages()
+
+    async def delete_file(self, file_id: str) -> bool:
+        """Delete a file by ID.
+
+        Args:
+            file_id: File ID to delete
+
+        Returns:
+            True if successful
+        """
+        deleted = await self.api.delete_file(file_id)
+        if self.dedup:
+            await self.dedup.index.discard(file_id=file_id)
+        return deleted
 
     async def close(self) -> None:
         """Close the storage client and cleanup resources."""
+        await self.queue.close()
+        if self._dispatcher:
+            await self._dispatcher.close()
         await self.api.close()
+        if self._dedup_db:
+            self._dedup_db.close()
 
     async def __aenter__(self) -> "ZenStorage":
         """Async context manager entry."""
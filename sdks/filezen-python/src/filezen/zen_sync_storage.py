@@ -0,0 +1,393 @@
+"""Synchronous storage client for the FileZen Python SDK."""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .constants import (
+    FILES_PAGE_SIZE,
+    FILES_PREFETCH,
+    LISTENER_QUEUE_SIZE,
+    PROGRESS_INTERVAL,
+)
+from .types import (
+    FinishMultipartUploadParams,
+    MultipartChunkUploadResult,
+    MultipartUploadChunkParams,
+    StartMultipartUploadParams,
+    ZenFile,
+    ZenList,
+    ZenStorageBulkItem,
+    ZenStorageUploadOptions,
+    ZenUploadSource,
+)
+from .zen_checkpoint import ZenUploadCheckpoint
+from .zen_chunk_sizer import ZenChunkSizer
+from .zen_dedup import ZenDedupIndex
+from .zen_journal import ZenUploadJournal
+from .zen_queue import ZenUploadPriority
+from .zen_retry import ZenRetryPolicy
+from .zen_storage import ZenBulkUploadSummary, ZenStorage, ZenUploadListener
+from .zen_upload import ZenUpload
+
+T = TypeVar("T")
+
+
+async def _anext(iterator: AsyncIterator[T]) -> T:
+    return await iterator.__anext__()
+
+
+class ZenSyncMultipartControl:
+    """Manual multipart upload control for ZenSyncStorage."""
+
+    def __init__(self, storage: "ZenSyncStorage"):
+        self._storage = storage
+
+    def start(
+        self,
+        params: Optional[Union[StartMultipartUploadParams, Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, str]:
+        """Start a multipart upload session. See ZenMultipartControl.start."""
+        multipart = self._storage.storage.multipart
+        return self._storage._run(multipart.start(params, **kwargs))
+
+    def upload_part(
+        self,
+        params: Optional[Union[MultipartUploadChunkParams, Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> MultipartChunkUploadResult:
+        """Upload a part of the multipart upload. See ZenMultipartControl.upload_part."""
+        multipart = self._storage.storage.multipart
+        return self._storage._run(multipart.upload_part(params, **kwargs))
+
+    def finish(
+        self,
+        params: Optional[
+            Union[FinishMultipartUploadParams, Dict[str, Any], str]
+        ] = None,
+        **kwargs: Any,
+    ) -> ZenFile:
+        """Finish the multipart upload. See ZenMultipartControl.finish."""
+        multipart = self._storage.storage.multipart
+        return self._storage._run(multipart.finish(params, **kwargs))
+
+
+class ZenSyncStorage:
+    """Synchronous storage client for FileZen.
+
+    Wraps a ZenStorage running on a private event loop in a background thread,
+    so blocking code (Django views, Celery tasks, scripts) gets the same
+    uploads, chunking, retries and a persistent connection pool without
+    creating an event loop per call. Calls may be made from any thread.
+
+    Listener callbacks run on the background thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        keep_uploads: bool = False,
+        journal: Optional[Union[str, "os.PathLike[str]", ZenUploadJournal]] = None,
+        adaptive_chunking: Union[bool, ZenChunkSizer] = False,
+        retry: Optional[ZenRetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        queue_workers: int = 4,
+        queue_limits: Optional[Dict[int, int]] = None,
+        progress_interval: float = PROGRESS_INTERVAL,
+        background_listeners: bool = False,
+        listener_queue_size: int = LISTENER_QUEUE_SIZE,
+        max_kept_uploads: Optional[int] = None,
+        kept_upload_ttl: Optional[float] = None,
+        dedup: Union[bool, str, "os.PathLike[str]", ZenDedupIndex] = False,
+        checksums: bool = True,
+        compression: Optional[str] = None,
+        raw_uploads: bool = False,
+    ):
+        """Initialize ZenSyncStorage.
+
+        Takes the same arguments as ZenStorage, except ``transport``: a transport
+        is bound to one event loop and this client owns its loop.
+
+        Examples:
+            with ZenSyncStorage(api_key="your_key") as storage:
+                upload = storage.upload(file_bytes, name="my_file.txt")
+                print(upload.file.url)
+        """
+        self.storage = ZenStorage(
+            api_key=api_key,
+            api_url=api_url,
+            keep_uploads=keep_uploads,
+            journal=journal,
+            adaptive_chunking=adaptive_chunking,
+            retry=retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            queue_workers=queue_workers,
+            queue_limits=queue_limits,
+            progress_interval=progress_interval,
+            background_listeners=background_listeners,
+            listener_queue_size=listener_queue_size,
+            max_kept_uploads=max_kept_uploads,
+            kept_upload_ttl=kept_upload_ttl,
+            dedup=dedup,
+            checksums=checksums,
+            compression=compression,
+            raw_uploads=raw_uploads,
+        )
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="filezen-sync", daemon=True
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop and wait for its result."""
+        if self._closed:
+            coro.close()
+            raise RuntimeError("ZenSyncStorage is closed")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "ZenSyncStorage cannot be called from its own listener callbacks"
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            # Interrupted (e.g. KeyboardInterrupt) - stop the work in flight
+            future.cancel()
+            raise
+
+    def _iter(self, iterator: AsyncGenerator[T, None]) -> Iterator[T]:
+        """Iterate an async generator on the background loop."""
+        try:
+            while True:
+                try:
+                    yield self._run(_anext(iterator))
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                self._run(iterator.aclose())
+
+    @property
+    def multipart(self) -> ZenSyncMultipartControl:
+        """Get multipart upload control."""
+        return ZenSyncMultipartControl(self)
+
+    def add_listener(self, listener: ZenUploadListener) -> None:
+        """Add an event listener."""
+        self.storage.add_listener(listener)
+
+    def remove_listener(self, listener: ZenUploadListener) -> None:
+        """Remove an event listener."""
+        self.storage.remove_listener(listener)
+
+    @property
+    def get_uploads(self) -> List[ZenUpload]:
+        """Get all uploads."""
+        return self.storage.get_uploads
+
+    @property
+    def active_uploads(self) -> List[ZenUpload]:
+        """Get active uploads."""
+        return self.storage.active_uploads
+
+    @property
+    def completed_uploads(self) -> List[ZenUpload]:
+        """Get completed uploads."""
+        return self.storage.completed_uploads
+
+    @property
+    def failed_uploads(self) -> List[ZenUpload]:
+        """Get failed uploads."""
+        return self.storage.failed_uploads
+
+    def upload(
+        self,
+        source: ZenUploadSource,
+        options: Optional[Union[Dict[str, Any], ZenStorageUploadOptions]] = None,
+        **kwargs: Any,
+    ) -> ZenUpload:
+        """Upload a file to FileZen. See ZenStorage.upload.
+
+        Sync iterables are accepted as streaming sources; async iterables are not,
+        since they belong to the caller's event loop.
+        """
+        return self._run(self.storage.upload(source, options, **kwargs))
+
+    def enqueue(
+        self,
+        source: ZenUploadSource,
+        options: Optional[Union[Dict[str, Any], ZenStorageUploadOptions]] = None,
+        *,
+        priority: int = ZenUploadPriority.NORMAL,
+        **kwargs: Any,
+    ) -> "concurrent.futures.Future[ZenUpload]":
+        """Queue an upload to run in the background. See ZenStorage.enqueue.
+
+        Returns:
+            A future resolving to the completed upload. Cancelling it cancels
+            the upload.
+        """
+
+        async def queued() -> ZenUpload:
+            return await self.storage.enqueue(
+                source, options, priority=priority, **kwargs
+            )
+
+        if self._closed:
+            raise RuntimeError("ZenSyncStorage is closed")
+        return asyncio.run_coroutine_threadsafe(queued(), self._loop)
+
+    def bulk_upload(
+        self,
+        *uploads: Union[Dict[str, Any], ZenStorageBulkItem],
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+    ) -> List[ZenUpload]:
+        """Upload multiple files in parallel. See ZenStorage.bulk_upload."""
+        return self._run(
+            self.storage.bulk_upload(
+                *uploads,
+                max_concurrency=max_concurrency,
+                max_inflight_bytes=max_inflight_bytes,
+            )
+        )
+
+    def bulk_upload_summary(
+        self,
+        *uploads: Union[Dict[str, Any], ZenStorageBulkItem],
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+    ) -> ZenBulkUploadSummary:
+        """Upload multiple files, collecting failures. See ZenStorage.bulk_upload_summary."""
+        return self._run(
+            self.storage.bulk_upload_summary(
+                *uploads,
+                max_concurrency=max_concurrency,
+                max_inflight_bytes=max_inflight_bytes,
+            )
+        )
+
+    def iter_bulk_upload(
+        self,
+        *uploads: Union[Dict[str, Any], ZenStorageBulkItem],
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+    ) -> Iterator[ZenUpload]:
+        """Upload multiple files, yielding each as it finishes. See ZenStorage.iter_bulk_upload."""
+        uploads_iter = cast(
+            AsyncGenerator[ZenUpload, None],
+            self.storage.iter_bulk_upload(
+                *uploads,
+                max_concurrency=max_concurrency,
+                max_inflight_bytes=max_inflight_bytes,
+            ),
+        )
+        return self._iter(uploads_iter)
+
+    def upload_stream(
+        self,
+        items: Iterable[Union[Dict[str, Any], ZenStorageBulkItem]],
+        *,
+        max_concurrency: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+        checkpoint: Optional[
+            Union[str, "os.PathLike[str]", ZenUploadCheckpoint]
+        ] = None,
+    ) -> Iterator[ZenUpload]:
+        """Upload items pulled lazily, yielding each as it finishes. See ZenStorage.upload_stream."""
+        uploads_iter = cast(
+            AsyncGenerator[ZenUpload, None],
+            self.storage.upload_stream(
+                items,
+                max_concurrency=max_concurrency,
+                max_inflight_bytes=max_inflight_bytes,
+                checkpoint=checkpoint,
+            ),
+        )
+        return self._iter(uploads_iter)
+
+    def list_files(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> ZenList:
+        """List files. See ZenStorage.list_files."""
+        return self._run(
+            self.storage.list_files(limit=limit, offset=offset, cursor=cursor)
+        )
+
+    def iter_files(
+        self, *, page_size: int = FILES_PAGE_SIZE, prefetch: int = FILES_PREFETCH
+    ) -> Iterator[ZenFile]:
+        """Iterate over every file, fetching pages ahead. See ZenStorage.iter_files."""
+        files_iter = cast(
+            AsyncGenerator[ZenFile, None],
+            self.storage.iter_files(page_size=page_size, prefetch=prefetch),
+        )
+        return self._iter(files_iter)
+
+    def delete_file(self, file_id: str) -> bool:
+        """Delete a file by ID."""
+        return self._run(self.storage.delete_file(file_id))
+
+    def delete_by_url(self, url: str) -> bool:
+        """Delete a file by its URL."""
+        return self._run(self.storage.delete_by_url(url))
+
+    def close(self) -> None:
+        """Close the storage client and stop its background loop."""
+        if self._closed:
+            return
+        try:
+            self._run(self.storage.close())
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> "ZenSyncStorage":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any],
+    ) -> None:
+        """Context manager exit."""
+        self.close()
@@ -1,17 +1,74 @@
 """Upload functionality for the FileZen Python SDK."""
 
-import base64
-import re
-from typing import Optional, Union
-
-from .constants import MULTIPART_CHUNK_SIZE, MULTIPART_THRESHOLD
-from .types import ZenFile, ZenMetadata
-from .utils import generate_local_id, is_base64, is_url
+import asyncio
+import hashlib
+import os
+import time
+from collections import deque
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+
+import httpx
+
+from .constants import (
+    CHUNK_CHECKSUM_ATTEMPTS,
+    COMPRESSION_BLOCK_SIZE,
+    COMPRESSION_SAMPLE_SIZE,
+    MULTIPART_CHUNK_SIZE,
+    MULTIPART_CONCURRENCY,
+    MULTIPART_THRESHOLD,
+    PROGRESS_INTERVAL,
+)
+from .types import (
+    ZenBuffer,
+    ZenFile,
+    ZenMetadata,
+    ZenMultipartChunkResponse,
+    ZenProgress,
+    ZenUploadSource,
+)
+from .utils import generate_local_id, to_memoryview
 from .zen_api import ZenApi
+from .zen_chunk_sizer import ZenChunkSizer
+from .zen_compression import (
+    compress,
+    compress_pieces,
+    is_compressible_type,
+    looks_compressible,
+)
 from .zen_error import ZenError, ZenUploadError, build_zen_error
+from .zen_journal import ZenJournalEntry, ZenUploadJournal
+from .zen_source import (
+    Base64Reader,
+    FileReader,
+    aiter_items,
+    content_digest,
+    iter_chunks,
+    resolve_source,
+    source_identity,
+)
+
+if TYPE_CHECKING:
+    from .zen_dedup import Deduplicator
+
+# Values of ZenUpload.state
+UPLOAD_STATES = ("active", "completed", "failed", "cancelled")
 
-# Type alias for upload sources
-ZenUploadSource = Union[bytes, str]
+# A streamed chunk's index, data and pending checksum
+_BufferedChunk = Tuple[int, ZenBuffer, "asyncio.Future[Optional[str]]"]
 
 
 class ZenUpload:
@@ -27,6 +84,17 @@ class ZenUpload:
         metadata: Optional[ZenMetadata] = None,
         project_id: Optional[str] = None,
         folder_id: Optional[str] = None,
+        multipart_concurrency: Optional[int] = None,
+        journal: Optional[ZenUploadJournal] = None,
+        resume: bool = False,
+        chunk_sizer: Optional[ZenChunkSizer] = None,
+        on_progress: Optional[Callable[["ZenUpload", ZenProgress], None]] = None,
+        progress_interval: float = PROGRESS_INTERVAL,
+        on_state_change: Optional[Callable[["ZenUpload"], None]] = None,
+        dedup: Optional["Deduplicator"] = None,
+        checksums: bool = True,
+        compression: Optional[str] = None,
+        source_kind: Optional[str] = None,
     ):
         # Upload configuration
         self.local_id = generate_local_id()
@@ -36,16 +104,92 @@ class ZenUpload:
         self.metadata = metadata
         self.project_id = project_id
         self.folder_id = folder_id
+        self.multipart_concurrency = max(
+            1, multipart_concurrency or MULTIPART_CONCURRENCY
+        )
 
         # Upload state (default values)
         self.file: Optional[ZenFile] = None
         self.error: Optional[ZenError] = None
         self.is_completed: bool = False
         self.is_cancelled: bool = False
+        # True when completed with an earlier upload of the same content
+        self.deduplicated: bool = False
 
         # Internal state
         self.api = api
-        self.source = source
+        # Typed sources are unwrapped and plain ones classified once, here,
+        # unless the caller already resolved the source and passes its kind
+        if source_kind is None:
+            self.source_kind, self.source = resolve_source(source)
+        else:
+            self.source_kind, self.source = source_kind, source
+        self.on_state_change = on_state_change
+        self.journal = journal
+        self.resume = resume
+        self.chunk_sizer = chunk_sizer
+        self.dedup = dedup
+        self.checksums = checksums
+        self.compression = compression
+        # Content-Encoding the source was uploaded with, if it was compressed
+        self.content_encoding: Optional[str] = None
+
+        # Digests of the chunks sent, by index, and how many chunks there are
+        self._chunk_checksums: Dict[int, str] = {}
+        self._chunk_count: Optional[int] = None
+
+        # Progress state - bytes of acknowledged parts plus parts in flight
+        self.bytes_sent = 0
+        self.total_bytes: Optional[int] = None
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self._acked_bytes = 0
+        self._part_bytes: Dict[int, int] = {}
+        self._progress_reported_at = 0.0
+        self._progress_timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def state(self) -> str:
+        """One of active, completed, failed or cancelled."""
+        if self.is_completed:
+            return "completed"
+        if self.error:
+            return "failed"
+        if self.is_cancelled:
+            return "cancelled"
+        return "active"
+
+    @property
+    def progress(self) -> ZenProgress:
+        """Bytes sent so far; ``total`` is None while a stream's size is unknown."""
+        percent = None
+        if self.total_bytes is not None:
+            percent = (
+                min(100.0, self.bytes_sent * 100 / self.total_bytes)
+                if self.total_bytes
+                else (100.0 if self.is_completed else 0.0)
+            )
+        return ZenProgress(
+            bytes=self.bytes_sent, total=self.total_bytes, percent=percent
+        )
+
+    @property
+    def checksum(self) -> Optional[str]:
+        """Composite digest of a multipart upload, as ``sha256:<hex>-<chunks>``.
+
+        The SHA-256 of the chunks' SHA-256 digests in index order. None unless
+        every chunk was checksummed by this upload.
+        """
+        count = self._chunk_count
+        if not count or len(self._chunk_checksums) < count:
+            return None
+        digest = hashlib.sha256()
+        for chunk_index in range(count):
+            checksum = self._chunk_checksums.get(chunk_index)
+            if checksum is None:
+                return None
+            digest.update(bytes.fromhex(checksum.split(":", 1)[1]))
+        return f"sha256:{digest.hexdigest()}-{count}"
 
     async def upload(self) -> "ZenUpload":
         """Perform the upload operation.
@@ -59,20 +203,17 @@ class ZenUpload:
             raise ZenUploadError("Upload not properly initialized: source is None")
 
         try:
-            # Handle different source types
-            if isinstance(self.source, str):
-                # String sources - route to appropriate handlers
-                if is_url(self.source):
-                    await self._url_upload()
-                elif is_base64(self.source):
-                    await self._base64_upload()
-                else:
-                    await self._text_upload()
+            if self.dedup:
+                await self.dedup.upload(self, self._send)
             else:
-                # Bytes source - route to bytes handler
-                await self._upload_from_bytes(self.source)
+                await self._send()
 
             self.is_completed = True
+            if self.total_bytes is None:
+                self.total_bytes = self.bytes_sent
+            self._report_progress(force=True)
+            # The payload is no longer needed; failed uploads keep it for a retry
+            self.source = None
 
         except Exception as e:
             if isinstance(e, ZenError):
@@ -80,19 +221,116 @@ class ZenUpload:
             else:
                 self.error = ZenUploadError(str(e))
             raise
+        finally:
+            if self._progress_timer:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+            if self.on_state_change:
+                self.on_state_change(self)
 
         return self
 
-    async def _upload_from_bytes(self, source: bytes) -> None:
-        """Handle bytes sources - decide between single vs multipart upload."""
+    async def _send(self) -> None:
+        """Send the source with the handler for its type."""
+        if self.compression and await self._compressed_upload(self.compression):
+            return
+
+        # Handle different source types
+        kind = self.source_kind
+        if kind == "url":
+            await self._url_upload()
+        elif kind == "base64":
+            await self._base64_upload()
+        elif kind == "text":
+            await self._text_upload()
+        elif kind == "file":
+            # Paths and file objects - read lazily, chunk by chunk
+            await self._file_upload()
+        elif kind == "stream":
+            # Iterables of unknown total size - streaming multipart upload
+            await self._streaming_upload(
+                iter_chunks(self.source, self._chunk_size)  # type: ignore[arg-type]
+            )
+        else:
+            # Buffer source - chunked through a memoryview, never copied
+            await self._upload_from_bytes(to_memoryview(self.source))
+
+    async def _compressed_upload(self, encoding: str) -> bool:
+        """Compress and upload the source if it is worth compressing.
+
+        Text, and sources of a compressible MIME type whose first bytes shrink
+        enough when compressed, are compressed off the event loop. Sources that
+        fit in a single upload are compressed whole; larger ones are compressed
+        as they are read and sent as a streaming upload, chunk by chunk. The
+        encoding is recorded in the metadata as ``contentEncoding``.
+
+        Returns:
+            Whether the source was uploaded; if not, it is sent uncompressed
+        """
+        source = self.source
+        kind = self.source_kind
+        if kind in ("url", "base64"):
+            return False
+        if kind == "text":
+            source = cast(str, source).encode("utf-8")
+        elif not is_compressible_type(self.mime_type):
+            return False
+
+        reader: Optional[FileReader] = None
+        pieces: AsyncIterator[ZenBuffer]
+        size: Optional[int]
+        if kind == "file":
+            reader = await FileReader.open(source)  # type: ignore[arg-type]
+            size = reader.size
+            sample = await reader.read(0, min(size, COMPRESSION_SAMPLE_SIZE))
+            pieces = _read_blocks(reader)
+        elif kind == "stream":
+            size = None
+            sample, pieces = await _peek(
+                aiter_items(source),  # type: ignore[arg-type]
+                COMPRESSION_SAMPLE_SIZE,
+            )
+        else:
+            view = to_memoryview(source)
+            size = view.nbytes
+            sample = bytes(view[:COMPRESSION_SAMPLE_SIZE])
+            pieces = _slice_blocks(view)
+
+        try:
+            if not looks_compressible(sample, size):
+                # A stream cannot be read twice - send the sampled pieces as is
+                if size is None:
+                    await self._streaming_upload(iter_chunks(pieces, self._chunk_size))
+                    return True
+                return False
+
+            self.content_encoding = encoding
+            self.metadata = {**(self.metadata or {}), "contentEncoding": encoding}
+            if size is not None and size <= self._multipart_threshold():
+                data = await reader.read(0, size) if reader else to_memoryview(source)
+                compressed = await compress(data, encoding)
+                self.total_bytes = len(compressed)
+                await self._single_upload_from_bytes(compressed)
+            else:
+                await self._streaming_upload(
+                    iter_chunks(compress_pieces(pieces, encoding), self._chunk_size)
+                )
+            return True
+        finally:
+            if reader:
+                reader.close()
+
+    async def _upload_from_bytes(self, source: memoryview) -> None:
+        """Handle buffer sources - decide between single vs multipart upload."""
+        self.total_bytes = source.nbytes
         # For small files, use single upload
-        if len(source) <= MULTIPART_THRESHOLD:
+        if source.nbytes <= self._multipart_threshold():
             await self._single_upload_from_bytes(source)
         else:
             await self._multipart_upload_from_bytes(source)
 
-    async def _single_upload_from_bytes(self, source: bytes) -> None:
-        """Perform a single upload for small bytes sources."""
+    async def _single_upload_from_bytes(self, source: ZenBuffer) -> None:
+        """Perform a single upload for small buffer sources."""
         assert self.api is not None
 
         result = await self.api.upload_file(
@@ -104,26 +342,113 @@ class ZenUpload:
                 "projectId": self.project_id,
                 "folderId": self.folder_id,
             },
+            on_progress=partial(self._part_progress, 0),
         )
 
         if result.error:
             raise ZenUploadError(result.error.get("message", "Upload failed"))
+        self._part_done(0, len(source))
 
         # Use the API response directly - it should already match ZenFile structure
         self.file = result.file
 
-    async def _multipart_upload_from_bytes(self, source: bytes) -> None:
-        """Perform a multipart upload for large bytes sources."""
+    async def _multipart_upload_from_bytes(self, source: memoryview) -> None:
+        """Perform a multipart upload for large buffer sources."""
+
+        async def read_chunk(start: int, end: int) -> ZenBuffer:
+            return source[start:end]
+
+        await self._multipart_upload(source.nbytes, read_chunk)
+
+    async def _file_upload(self) -> None:
+        """Perform upload from a path or binary file object source."""
+        assert self.source is not None
+
+        reader = await FileReader.open(self.source)  # type: ignore[arg-type]
+        self.total_bytes = reader.size
+        try:
+            if reader.size <= self._multipart_threshold():
+                await self._single_upload_from_bytes(await reader.read(0, reader.size))
+            else:
+                await self._multipart_upload(reader.size, reader.read)
+        finally:
+            reader.close()
+
+    async def _multipart_upload(
+        self,
+        file_size: int,
+        read_chunk: Callable[[int, int], Awaitable[ZenBuffer]],
+    ) -> None:
+        """Perform a multipart upload for a sized source read chunk by chunk.
+
+        With a journal, the session and its acknowledged chunks are recorded as
+        the upload progresses. With ``resume`` set, a recorded session for the
+        same source continues from its first unacknowledged chunk.
+        """
+        assert self.api is not None
+
+        self.total_bytes = file_size
+        source_id = await source_identity(self.source) if self.journal else None
+        journal_key = self._journal_key(source_id, file_size) if source_id else None
+        entry = None
+        loop = asyncio.get_running_loop()
+        if journal_key and self.journal and self.resume:
+            entry = await loop.run_in_executor(None, self.journal.load, journal_key)
+            if entry and (
+                entry.source_id != source_id or entry.total_size != file_size
+            ):
+                entry = None
+
+        if entry:
+            try:
+                await self._upload_chunks(
+                    entry.session_id,
+                    file_size,
+                    entry.chunk_size,
+                    read_chunk,
+                    acknowledged=entry.acknowledged,
+                    journal_key=journal_key,
+                )
+            except ZenError as e:
+                # The server no longer knows the session - start over
+                if e.code not in ("404", "410"):
+                    raise
+                entry = None
+                self._acked_bytes = 0
+                self._part_bytes.clear()
+
+        if not entry:
+            await self._start_multipart_upload(
+                file_size, read_chunk, journal_key, source_id
+            )
+
+        if journal_key and self.journal:
+            await self.journal.flush()
+            await loop.run_in_executor(None, self.journal.remove, journal_key)
+
+        if not self.file:
+            raise ZenUploadError("Multipart upload did not complete as expected")
+
+    async def _start_multipart_upload(
+        self,
+        file_size: int,
+        read_chunk: Callable[[int, int], Awaitable[ZenBuffer]],
+        journal_key: Optional[str] = None,
+        source_id: Optional[str] = None,
+    ) -> None:
+        """Initialize a new multipart session and upload every chunk."""
         assert self.api is not None
 
-        file_size = len(source)
+        # The session's chunk size is fixed once it is initialized
+        chunk_size = self._chunk_size()
+
         # Initialize multipart upload
         init_result = await self.api.initialize_multipart_upload(
             {
                 "fileName": self.name,
                 "mimeType": self.mime_type or "application/octet-stream",
                 "totalSize": file_size,
-                "chunkSize": MULTIPART_CHUNK_SIZE,
+                "chunkSize": chunk_size,
                 "metadata": self.metadata,
                 "projectId": self.project_id,
                 "parentId": self.folder_id,
@@ -137,42 +462,296 @@ class ZenUpload:
                 )
             )
 
-        session_id = init_result.id
-        total_chunks = (file_size + MULTIPART_CHUNK_SIZE - 1) // MULTIPART_CHUNK_SIZE
-        current_chunk_index = 0
+        if journal_key and source_id and self.journal:
+            entry = ZenJournalEntry(
+                session_id=init_result.id,
+                source_id=source_id,
+                chunk_size=chunk_size,
+                total_size=file_size,
+            )
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.journal.start, journal_key, entry
+            )
 
-        while current_chunk_index < total_chunks:
-            # Calculate chunk boundaries
-            start = current_chunk_index * MULTIPART_CHUNK_SIZE
-            end = min(start + MULTIPART_CHUNK_SIZE, file_size)
-            chunk = source[start:end]
-            chunk_size = len(chunk)
+        await self._upload_chunks(
+            init_result.id,
+            file_size,
+            chunk_size,
+            read_chunk,
+            journal_key=journal_key,
+        )
 
-            # Upload chunk
-            chunk_result = await self.api.upload_chunk(
-                session_id, chunk, current_chunk_index, chunk_size
-            )
+    def _chunk_size(self) -> int:
+        """Chunk size for the next multipart session or streaming chunk."""
+        if self.chunk_sizer:
+            return self.chunk_sizer.chunk_size
+        return MULTIPART_CHUNK_SIZE
+
+    def _multipart_threshold(self) -> int:
+        """Largest source size that is sent as a single upload."""
+        if self.chunk_sizer:
+            # A source that fits in one chunk gains nothing from multipart
+            return self.chunk_sizer.chunk_size
+        return MULTIPART_THRESHOLD
+
+    def inflight_bytes(self) -> int:
+        """Estimate the most bytes this upload holds in memory at once.
+
+        Single uploads hold the whole source. Multipart uploads hold one chunk
+        per concurrent part, and up to as many again read and hashed ahead of
+        their send; streaming uploads buffer as many chunks ahead.
+        """
+        # Chunks being sent, and chunks read ahead of them
+        window = 2 * self._chunk_size() * self.multipart_concurrency
+        source = self.source
+
+        kind = self.source_kind
+        if kind in ("url", "stream"):
+            return window
+        if kind == "text":
+            # Sent as UTF-8, which takes up to 4 bytes per character
+            text = cast(str, source)
+            return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+        size: Optional[int] = None
+        try:
+            if kind == "base64":
+                # Base64 is decoded chunk by chunk, like a file
+                size = len(cast(str, source)) * 3 // 4
+            elif isinstance(source, os.PathLike):
+                size = os.stat(os.fspath(source)).st_size
+            elif kind == "file":
+                file = cast(BinaryIO, source)
+                size = os.fstat(file.fileno()).st_size - file.tell()
+            else:
+                size = to_memoryview(source).nbytes
+        except (AttributeError, OSError, TypeError, ValueError):
+            pass
+
+        if size is None:
+            return window
+        if size <= self._multipart_threshold():
+            return size
+        return min(size, window)
 
-            if chunk_result.error:
+    async def _chunk_checksum(self, chunk: ZenBuffer) -> Optional[str]:
+        """Digest of a chunk, hashed off the event loop unless it is small."""
+        return await content_digest(chunk) if self.checksums else None
+
+    async def _send_chunk(
+        self,
+        session_id: str,
+        chunk: ZenBuffer,
+        chunk_index: int,
+        checksum: Optional[str] = None,
+    ) -> ZenMultipartChunkResponse:
+        """Upload one chunk, reporting its round trip to the chunk sizer.
+
+        The chunk's checksum is sent with it. If the server reports a different
+        digest for what it received, the chunk alone is sent again.
+        """
+        assert self.api is not None
+
+        if checksum is None:
+            checksum = await self._chunk_checksum(chunk)
+
+        for attempt in range(1, CHUNK_CHECKSUM_ATTEMPTS + 1):
+            started = time.monotonic()
+            try:
+                result = await self.api.upload_chunk(
+                    session_id,
+                    chunk,
+                    chunk_index,
+                    len(chunk),
+                    on_progress=partial(self._part_progress, chunk_index),
+                    checksum=checksum,
+                )
+            except ZenError:
+                self._part_bytes.pop(chunk_index, None)
+                if self.chunk_sizer:
+                    self.chunk_sizer.record_failure()
+                raise
+            if self.chunk_sizer:
+                self.chunk_sizer.record(len(chunk), time.monotonic() - started)
+            if checksum is None or _same_checksum(checksum, result.checksum):
+                break
+            self._part_bytes.pop(chunk_index, None)
+            if attempt == CHUNK_CHECKSUM_ATTEMPTS:
                 raise ZenUploadError(
-                    chunk_result.error.get(
-                        "message", f"Chunk {current_chunk_index} upload failed"
+                    f"Chunk {chunk_index} was corrupted in transit: sent "
+                    f"{checksum}, server received {result.checksum}"
+                )
+
+        if checksum is not None:
+            self._chunk_checksums[chunk_index] = checksum
+        self._part_done(chunk_index, len(chunk))
+        return result
+
+    def _part_progress(self, part: int, sent: int) -> None:
+        """Record the bytes of a part in flight sent so far."""
+        self._part_bytes[part] = sent
+        self._update_progress()
+
+    def _part_done(self, part: int, size: int) -> None:
+        """Record that the server received a part."""
+        self._part_bytes.pop(part, None)
+        self._acked_bytes += size
+        self._update_progress()
+
+    def _update_progress(self) -> None:
+        sent = self._acked_bytes + sum(self._part_bytes.values())
+        if self.total_bytes is not None:
+            # A chunk the server asked for again is counted twice
+            sent = min(sent, self.total_bytes)
+        self.bytes_sent = sent
+        self._report_progress()
+
+    def _report_progress(self, force: bool = False) -> None:
+        """Deliver progress to on_progress, at most once per progress_interval.
+
+        Updates inside the interval are coalesced; the latest is delivered when
+        the interval ends.
+        """
+        if not self.on_progress:
+            return
+        now = time.monotonic()
+        due = self._progress_reported_at + self.progress_interval
+        if force or now >= due:
+            if self._progress_timer:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+            self._progress_reported_at = now
+            self.on_progress(self, self.progress)
+        elif self._progress_timer is None:
+            self._progress_timer = asyncio.get_running_loop().call_later(
+                due - now, self._flush_progress
+            )
+
+    def _flush_progress(self) -> None:
+        self._progress_timer = None
+        self._report_progress(force=True)
+
+    def _journal_key(self, source_id: str, file_size: int) -> str:
+        """Key identifying this upload's source and destination in the journal."""
+        key = "|".join(
+            [source_id, str(file_size), self.name]
+            + [self.folder_id or "", self.project_id or ""]
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    async def _upload_chunks(
+        self,
+        session_id: str,
+        file_size: int,
+        chunk_size: int,
+        read_chunk: Callable[[int, int], Awaitable[ZenBuffer]],
+        acknowledged: Optional[Set[int]] = None,
+        journal_key: Optional[str] = None,
+    ) -> None:
+        """Upload the chunks of a sized multipart session.
+
+        Keeps up to ``multipart_concurrency`` chunks in flight. Chunks are sent in
+        index order, skipping those already ``acknowledged``; ``next_chunk_index``
+        from the server marks every lower chunk as received. That chunk is queued
+        next only if it was never sent: responses to concurrent chunks can name
+        one that has been acknowledged since, or is still in flight. The first
+        ``is_complete`` response finishes the upload.
+        """
+        assert self.api is not None
+
+        total_chunks = (file_size + chunk_size - 1) // chunk_size
+        acknowledged = set(acknowledged or ())
+        for chunk_index in acknowledged:
+            start = chunk_index * chunk_size
+            self._acked_bytes += max(0, min(chunk_size, file_size - start))
+        # If every chunk was acknowledged, resend the last to learn the result
+        pending = deque(
+            [i for i in range(total_chunks) if i not in acknowledged]
+            or [total_chunks - 1]
+        )
+        in_flight: Dict[asyncio.Future[ZenMultipartChunkResponse], int] = {}
+        self._chunk_count = total_chunks
+        # Chunks read and hashed ahead of their send, by index
+        prepared: Dict[int, asyncio.Future[Tuple[ZenBuffer, Optional[str]]]] = {}
+
+        async def read_and_hash(chunk_index: int) -> Tuple[ZenBuffer, Optional[str]]:
+            start = chunk_index * chunk_size
+            end = min(start + chunk_size, file_size)
+            chunk = await read_chunk(start, end)
+            return chunk, await self._chunk_checksum(chunk)
+
+        def prepare(
+            chunk_index: int,
+        ) -> "asyncio.Future[Tuple[ZenBuffer, Optional[str]]]":
+            if chunk_index not in prepared:
+                prepared[chunk_index] = asyncio.ensure_future(
+                    read_and_hash(chunk_index)
+                )
+            return prepared[chunk_index]
+
+        async def send_chunk(chunk_index: int) -> ZenMultipartChunkResponse:
+            try:
+                chunk, checksum = await prepare(chunk_index)
+            finally:
+                prepared.pop(chunk_index, None)
+            # Read and hash the next chunk while this one is on the wire
+            if pending:
+                prepare(pending[0])
+            return await self._send_chunk(session_id, chunk, chunk_index, checksum)
+
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.multipart_concurrency:
+                    chunk_index = pending.popleft()
+                    in_flight[asyncio.ensure_future(send_chunk(chunk_index))] = (
+                        chunk_index
                     )
+
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in sorted(done, key=in_flight.__getitem__):
+                    chunk_index = in_flight.pop(task)
+                    chunk_result = task.result()
 
-            # Check if upload is complete
-            if chunk_result.is_complete:
-                if chunk_result.file:
-                    self.file = chunk_result.file
-                break
+                    if chunk_result.error:
+                        raise ZenUploadError(
+                            chunk_result.error.get(
+                                "message", f"Chunk {chunk_index} upload failed"
+                            )
+                        )
 
-            # Move to next chunk
-            current_chunk_index = (
-                chunk_result.next_chunk_index or current_chunk_index + 1
-            )
+                    # Check if upload is complete
+                    if chunk_result.is_complete:
+                        if chunk_result.file:
+                            self.file = chunk_result.file
+                        return
 
-        if not self.file:
-            raise ZenUploadError("Multipart upload did not complete as expected")
+                    acknowledged.add(chunk_index)
+                    if journal_key and self.journal:
+                        await self.journal.record(journal_key, chunk_index)
+
+                    next_index = chunk_result.next_chunk_index
+                    if next_index and next_index < total_chunks:
+                        # Everything below the requested chunk has been received
+                        for received in [i for i in pending if i < next_index]:
+                            pending.remove(received)
+                            acknowledged.add(received)
+                            read_ahead = prepared.pop(received, None)
+                            if read_ahead:
+                                read_ahead.cancel()
+                        if (
+                            next_index not in acknowledged
+                            and next_index not in in_flight.values()
+                            and next_index not in pending
+                        ):
+                            pending.appendleft(next_index)
+        finally:
+            tasks: List[asyncio.Future[Any]] = [*in_flight, *prepared.values()]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _url_upload(self) -> None:
         """Perform upload from URL string source using streaming."""
@@ -180,7 +759,69 @@ class ZenUpload:
         assert self.source is not None
         assert isinstance(self.source, str)
 
-        # For URLs, we'll use streaming multipart upload since we don't know the size
+        # Sources that serve byte ranges are fetched one range per chunk of a
+        # sized session, which multipart_concurrency runs in parallel and which
+        # can resume, unlike a single stream
+        file_size = await self._probe_url_size()
+        if file_size and file_size > self._multipart_threshold():
+            await self._multipart_upload(file_size, self._read_url_range)
+            return
+
+        # Stream from URL - fetch and upload chunks as they arrive
+        async with self.api.source_client.stream("GET", self.source) as response:
+            response.raise_for_status()
+            await self._streaming_upload(
+                iter_chunks(response.aiter_bytes(), self._chunk_size)
+            )
+
+    async def _probe_url_size(self) -> Optional[int]:
+        """Return the size of the URL source if it serves byte ranges."""
+        assert self.api is not None
+        assert isinstance(self.source, str)
+
+        try:
+            response = await self.api.source_client.head(
+                self.source, headers={"Accept-Encoding": "identity"}
+            )
+        except httpx.RequestError:
+            return None
+
+        headers = response.headers
+        if (
+            response.status_code != 200
+            or headers.get("Accept-Ranges", "").lower() != "bytes"
+            or headers.get("Content-Encoding", "identity").lower() != "identity"
+        ):
+            return None
+        try:
+            return int(headers["Content-Length"])
+        except (KeyError, ValueError):
+            return None
+
+    async def _read_url_range(self, start: int, end: int) -> bytes:
+        """Fetch bytes ``[start, end)`` of the URL source with a range request."""
+        assert self.api is not None
+        assert isinstance(self.source, str)
+
+        response = await self.api.source_client.get(
+            self.source,
+            headers={
+                "Range": f"bytes={start}-{end - 1}",
+                "Accept-Encoding": "identity",
+            },
+        )
+        response.raise_for_status()
+        if response.status_code != 206 or len(response.content) != end - start:
+            raise ZenUploadError(
+                f"Source URL did not honour byte range {start}-{end - 1}"
+            )
+        return response.content
+
+    async def _streaming_upload(self, chunks: AsyncIterator[ZenBuffer]) -> None:
+        """Perform a streaming multipart upload from chunks of unknown total size."""
+        assert self.api is not None
+
+        # Streaming mode since we don't know the size up front
         session_result = await self.api.initialize_multipart_upload(
             {
                 "fileName": self.name,
@@ -197,66 +838,106 @@ class ZenUpload:
 
         session_id = session_result.id
 
-        # Stream from URL - fetch and upload chunks as they arrive
-        async with self.api.client.stream("GET", self.source) as response:
-            response.raise_for_status()
+        # A reader task fills a bounded prefetch buffer while up to
+        # multipart_concurrency senders drain it; streaming mode accepts
+        # chunks in any order, so they complete independently
+        senders = self.multipart_concurrency
+        # Buffered chunks are hashed while earlier ones are on the wire
+        buffer: asyncio.Queue[Optional[_BufferedChunk]] = asyncio.Queue(maxsize=senders)
+        # Checksums still being computed, cancelled if the upload stops early
+        hashing: Set[asyncio.Future[Optional[str]]] = set()
+
+        async def read_chunks() -> bool:
+            chunk_index = 0
+            async for chunk in chunks:
+                if len(chunk):
+                    checksum = asyncio.ensure_future(self._chunk_checksum(chunk))
+                    hashing.add(checksum)
+                    checksum.add_done_callback(hashing.discard)
+                    await buffer.put((chunk_index, chunk, checksum))
+                    chunk_index += 1
+            self._chunk_count = chunk_index
+            for _ in range(senders):
+                await buffer.put(None)
+            return False
+
+        async def send_chunks() -> bool:
+            while True:
+                item = await buffer.get()
+                if item is None:
+                    return False
+                chunk_index, chunk, checksum = item
+                chunk_result = await self._send_chunk(
+                    session_id, chunk, chunk_index, await checksum
+                )
+                if chunk_result.error:
+                    raise build_zen_error(chunk_result.error)
 
-            # Stream file content in chunks and upload immediately
-            async for chunk in response.aiter_bytes(MULTIPART_CHUNK_SIZE):
-                if chunk:
-                    # Upload chunk immediately without storing chunk_index
-                    chunk_result = await self.api.upload_chunk(
-                        session_id, chunk, 0, len(chunk)
-                    )
-                    if chunk_result.error:
-                        raise build_zen_error(chunk_result.error)
+                if chunk_result.is_complete:
+                    self.file = chunk_result.file
+                    return True
 
-                    if chunk_result.is_complete:
-                        self.file = chunk_result.file
+        tasks = {asyncio.ensure_future(read_chunks())}
+        tasks.update(asyncio.ensure_future(send_chunks()) for _ in range(senders))
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.result():
                         return
+        finally:
+            # Drop the chunks left in the buffer along with their checksums
+            while not buffer.empty():
+                buffer.get_nowait()
+            outstanding: List[asyncio.Future[Any]] = [*tasks, *hashing]
+            for future in outstanding:
+                future.cancel()
+            if outstanding:
+                await asyncio.gather(*outstanding, return_exceptions=True)
 
         # Finish multipart upload for streaming mode
-        finish_result = await self.api.finish_multipart_upload(session_id)
+        finish_result = await self.api.finish_multipart_upload(
+            session_id, self.checksum
+        )
         self.file = finish_result
 
     async def _base64_upload(self) -> None:
-        """Perform upload from base64 string source."""
+        """Perform upload from base64 string or data URL source.
+
+        The source is decoded range by range as it is sent: whole when it fits in
+        a single upload, chunk by chunk through a multipart upload otherwise.
+        """
         assert self.api is not None
         assert self.source is not None
         assert isinstance(self.source, str)
 
-        params = {
-            "name": self.name,
-            "mimeType": self.mime_type or "application/octet-stream",
-            "metadata": self.metadata,
-            "projectId": self.project_id,
-            "folderId": self.folder_id,
-        }
+        def decode_error(e: ValueError) -> ZenUploadError:
+            # Sniffing samples a string, so text can pass for base64
+            return ZenUploadError(
+                f"Failed to decode base64: {str(e)}. "
+                "Wrap text in ZenTextSource to upload it as is"
+            )
 
         try:
-            # Handle data URL format
-            if self.source.startswith("data:"):
-                header, data = self.source.split(",", 1)
-                # Extract MIME type from data URL
-                mime_match = re.search(r"data:([^;]+)", header)
-                if mime_match and not params.get("mimeType"):
-                    params["mimeType"] = mime_match.group(1)
-            else:
-                data = self.source
-
-            # Decode base64
-            file_bytes = base64.b64decode(data)
-
-            # Upload the decoded bytes
-            result = await self.api.upload_file(file_bytes, params)
-
-        except Exception as e:
-            raise ZenUploadError(f"Failed to decode base64: {str(e)}") from e
-
-        if result.error:
-            raise ZenUploadError(result.error.get("message", "Base64 upload failed"))
-
-        self.file = result.file
+            reader = Base64Reader(self.source)
+        except ValueError as e:
+            raise decode_error(e) from e
+        if not self.mime_type and reader.mime_type:
+            self.mime_type = reader.mime_type
+
+        async def read_chunk(start: int, end: int) -> ZenBuffer:
+            try:
+                return await reader.read(start, end)
+            except ValueError as e:
+                raise decode_error(e) from e
+
+        self.total_bytes = reader.size
+        if reader.size <= self._multipart_threshold():
+            await self._single_upload_from_bytes(await read_chunk(0, reader.size))
+        else:
+            await self._multipart_upload(reader.size, read_chunk)
 
     async def _text_upload(self) -> None:
         """Perform upload from text string source."""
@@ -275,15 +956,62 @@ class ZenUpload:
 
         # Convert text to bytes
         file_bytes = self.source.encode("utf-8")
+        self.total_bytes = len(file_bytes)
 
         # Upload the text as bytes
-        result = await self.api.upload_file(file_bytes, params)
+        result = await self.api.upload_file(
+            file_bytes, params, on_progress=partial(self._part_progress, 0)
+        )
 
         if result.error:
             raise ZenUploadError(result.error.get("message", "Text upload failed"))
+        self._part_done(0, len(file_bytes))
 
         self.file = result.file
 
     def cancel(self) -> None:
         """Cancel the upload operation."""
         self.is_cancelled = True
+        if self.on_state_change:
+            self.on_state_change(self)
+
+
+def _same_checksum(sent: str, received: Optional[str]) -> bool:
+    """Whether the server's digest matches; servers that report none match."""
+    if not received:
+        return True
+    return received.lower().split(":")[-1] == sent.split(":", 1)[1]
+
+
+async def _read_blocks(reader: FileReader) -> AsyncIterator[ZenBuffer]:
+    """Read a file in blocks, one at a time."""
+    for start in range(0, reader.size, COMPRESSION_BLOCK_SIZE):
+        yield await reader.read(start, min(start + COMPRESSION_BLOCK_SIZE, reader.size))
+
+
+async def _slice_blocks(view: memoryview) -> AsyncIterator[ZenBuffer]:
+    """Slice a buffer into blocks without copying it."""
+    for start in range(0, view.nbytes, COMPRESSION_BLOCK_SIZE):
+        yield view[start : start + COMPRESSION_BLOCK_SIZE]
+
+
+async def _peek(
+    pieces: AsyncIterator[ZenBuffer], size: int
+) -> Tuple[bytes, AsyncIterator[ZenBuffer]]:
+    """Return the first ``size`` bytes of a stream, and the whole stream."""
+    head: List[ZenBuffer] = []
+    sampled = 0
+    async for piece in pieces:
+        head.append(piece)
+        sampled += len(piece)
+        if sampled >= size:
+            break
+
+    async def replay() -> AsyncIterator[ZenBuffer]:
+        for piece in head:
+            yield piece
+        async for piece in pieces:
+            yield piece
+
+    sample = b"".join(bytes(piece) for piece in head)[:size]
+    return sample, replay()
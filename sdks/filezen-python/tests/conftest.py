@@ -0,0 +1,182 @@
+"""Shared fixtures for the FileZen Python SDK tests."""
+
+import asyncio
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from filezen import ZenStorage
+
+
+class FakeFileZen:
+    """In-memory FileZen API served through ``httpx.MockTransport``.
+
+    Uploaded files and multipart sessions are kept in memory. Requests to other
+    hosts are served from ``origin``, a third-party server honouring byte
+    ranges unless ``origin_ranges`` is off, and recorded in ``origin_requests``. Queued ``failures`` answer the
+    next API requests, in order, before they are handled. A chunk's
+    response is computed when it arrives and returned after
+    ``chunk_delays[chunk_index]`` seconds, so tests can reorder responses. A
+    chunk index in ``chunk_failures`` is refused once with that status.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.uploads: List[bytes] = []
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.chunk_delays: Dict[int, float] = {}
+        self.chunk_failures: Dict[int, int] = {}
+        self.origin = b""
+        self.origin_ranges = True
+        # Files served by GET /files, at most max_limit per page
+        self.files: List[Dict[str, Any]] = []
+        self.max_limit: Optional[int] = None
+        self.cursor_paging = False
+        self.report_total = True
+        self.origin_requests: List[httpx.Request] = []
+        self.failures: List[httpx.Response] = []
+
+    @staticmethod
+    def _payload(request: httpx.Request) -> bytes:
+        body = request.content
+        if request.headers.get("content-type", "").startswith("multipart/form-data"):
+            match = re.search(
+                rb"filename=.*?\r\n\r\n(.*)\r\n--[0-9a-f]+--\r\n$", body, re.S
+            )
+            assert match is not None
+            return match.group(1)
+        return body
+
+    @staticmethod
+    def _file(name: str, size: int) -> Dict[str, Any]:
+        return {
+            "id": f"file-{name}",
+            "name": name,
+            "size": size,
+            "type": "file",
+            "state": "completed",
+            "mimeType": "application/octet-stream",
+            "region": "eu",
+            "url": f"https://cdn.test/{name}",
+        }
+
+    def _serve_origin(self, request: httpx.Request) -> httpx.Response:
+        self.origin_requests.append(request)
+        headers = {"Content-Length": str(len(self.origin))}
+        if self.origin_ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+        byte_range = request.headers.get("range")
+        if byte_range is None or not self.origin_ranges:
+            return httpx.Response(200, content=self.origin)
+        start, end = (int(i) for i in byte_range.split("=")[1].split("-"))
+        return httpx.Response(206, content=self.origin[start : end + 1])
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        if request.url.host != "api.filezen.dev":
+            return self._serve_origin(request)
+        self.requests.append(request)
+        if self.failures:
+            return self.failures.pop(0)
+        path = request.url.path
+
+        if path == "/files/upload":
+            payload = self._payload(request)
+            self.uploads.append(payload)
+            return httpx.Response(200, json=self._file("upload", len(payload)))
+
+        if path == "/files/chunk-upload/initialize":
+            session_id = f"session-{len(self.sessions)}"
+            self.sessions[session_id] = {
+                "params": json.loads(request.content),
+                "chunks": {},
+            }
+            return httpx.Response(200, json={"id": session_id})
+
+        if path == "/files/chunk-upload/part":
+            session = self.sessions[request.headers["chunk-session-id"]]
+            chunk_index = int(request.headers["chunk-index"])
+            if chunk_index in self.chunk_failures:
+                return httpx.Response(self.chunk_failures.pop(chunk_index))
+            session["chunks"][chunk_index] = self._payload(request)
+            params = session["params"]
+            if params.get("uploadMode") == "streaming":
+                return httpx.Response(200, json={"isComplete": False})
+            total = int(params["totalSize"])
+            chunk_size = int(params["chunkSize"])
+            count = (total + chunk_size - 1) // chunk_size
+            missing = [i for i in range(count) if i not in session["chunks"]]
+            if missing:
+                body: Dict[str, Any] = {
+                    "isComplete": False,
+                    "nextChunkIndex": missing[0],
+                }
+            else:
+                session["data"] = b"".join(session["chunks"][i] for i in range(count))
+                body = {
+                    "isComplete": True,
+                    "file": self._file(params["fileName"], total),
+                }
+            await asyncio.sleep(self.chunk_delays.get(chunk_index, 0))
+            return httpx.Response(200, json=body)
+
+        if path.startswith("/files/chunk-upload/finish/"):
+            session = self.sessions[path.rsplit("/", 1)[1]]
+            chunks = session["chunks"]
+            session["data"] = b"".join(chunks[i] for i in sorted(chunks))
+            name = session["params"]["fileName"]
+            return httpx.Response(200, json=self._file(name, len(session["data"])))
+
+        if path == "/files" and request.method == "GET":
+            return self._list_files(request)
+
+        return httpx.Response(404, json={"message": "Not found"})
+
+    def _list_files(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        limit = int(params["limit"])
+        if self.max_limit:
+            limit = min(limit, self.max_limit)
+        offset = int(params.get("cursor") or params.get("offset") or 0)
+        data = self.files[offset : offset + limit]
+        body: Dict[str, Any] = {
+            "data": data,
+            "page": offset // limit,
+            "pageCount": -(-len(self.files) // limit),
+            "count": len(data),
+            "total": len(self.files) if self.report_total else 0,
+        }
+        if self.cursor_paging:
+            more = offset + limit < len(self.files)
+            body["nextCursor"] = str(offset + limit) if more else None
+        return httpx.Response(200, json=body)
+
+    def list_requests(self) -> List[httpx.Request]:
+        """GET /files requests, in the order they arrived."""
+        return [r for r in self.requests if r.url.path == "/files"]
+
+    def chunk_indexes(self) -> List[int]:
+        """Indexes of the chunks sent, in the order they arrived."""
+        return [
+            int(request.headers["chunk-index"])
+            for request in self.requests
+            if request.url.path == "/files/chunk-upload/part"
+        ]
+
+
+@pytest.fixture
+def api() -> FakeFileZen:
+    return FakeFileZen()
+
+
+@pytest_asyncio.fixture
+async def storage(api: FakeFileZen) -> AsyncIterator[ZenStorage]:
+    storage = ZenStorage(api_key="test-key", transport=httpx.MockTransport(api.handler))
+    yield storage
+    await storage.close()
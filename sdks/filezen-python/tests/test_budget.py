@@ -0,0 +1,39 @@
+"""Tests for ByteBudget."""
+
+import asyncio
+
+import pytest
+
+from filezen.zen_budget import ByteBudget
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_racing_a_release() -> None:
+    budget = ByteBudget(10)
+    held = await budget.acquire(10)
+    waiting = asyncio.ensure_future(budget.acquire(5))
+    await asyncio.sleep(0)
+
+    # The release drops the cancelled waiter before it handles its cancellation
+    waiting.cancel()
+    budget.release(held)
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert budget.used == 0
+    assert await budget.acquire(10) == 10
+
+
+@pytest.mark.asyncio
+async def test_waiter_cancelled_after_its_grant_hands_bytes_back() -> None:
+    budget = ByteBudget(10)
+    held = await budget.acquire(10)
+    waiting = asyncio.ensure_future(budget.acquire(5))
+    await asyncio.sleep(0)
+
+    budget.release(held)
+    waiting.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert budget.used == 0
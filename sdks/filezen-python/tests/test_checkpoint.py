@@ -0,0 +1,38 @@
+"""Tests for ZenUploadCheckpoint."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from filezen import ZenStorage, ZenUploadCheckpoint
+
+from .conftest import FakeFileZen
+
+
+@pytest.mark.asyncio
+async def test_resumed_stream_skips_non_str_keys(
+    api: FakeFileZen, storage: ZenStorage, tmp_path: Path
+) -> None:
+    path = tmp_path / "job.checkpoint"
+    items = [{"key": i, "source": f"item {i}".encode()} for i in range(5)]
+
+    first = [u async for u in storage.upload_stream(items[:3], checkpoint=path)]
+    assert len(first) == 3
+
+    resumed = [u async for u in storage.upload_stream(items, checkpoint=path)]
+    assert len(resumed) == 2
+    assert sorted(api.uploads[3:]) == [b"item 3", b"item 4"]
+    assert len(ZenUploadCheckpoint(path)) == 5
+
+
+@pytest.mark.asyncio
+async def test_record_batches_concurrent_keys(tmp_path: Path) -> None:
+    path = tmp_path / "job.checkpoint"
+    checkpoint = ZenUploadCheckpoint(path)
+
+    await asyncio.gather(*(checkpoint.record(i) for i in range(100)))
+
+    assert 42 in checkpoint and "42" in checkpoint
+    assert len(path.read_text().splitlines()) == 100
+    assert len(ZenUploadCheckpoint(path)) == 100
@@ -0,0 +1,127 @@
+"""Tests for compressed uploads."""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from filezen import ZenStorage, zen_upload
+
+from .conftest import FakeFileZen
+
+CHUNK_SIZE = 64 * 1024
+TEXT = b'{"message": "compress me"}\n' * 4096
+JSON = "application/json"
+
+
+@pytest_asyncio.fixture
+async def gzip_storage(api: FakeFileZen) -> AsyncIterator[ZenStorage]:
+    storage = ZenStorage(
+        api_key="test-key",
+        transport=httpx.MockTransport(api.handler),
+        compression="gzip",
+    )
+    yield storage
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_gzip_round_trip(api: FakeFileZen, gzip_storage: ZenStorage) -> None:
+    upload = await gzip_storage.upload(TEXT, name="data.json", mime_type=JSON)
+
+    assert upload.content_encoding == "gzip"
+    assert len(api.uploads[0]) < len(TEXT)
+    assert gzip.decompress(api.uploads[0]) == TEXT
+    assert b'"contentEncoding": "gzip"' in api.requests[0].content
+
+
+@pytest.mark.asyncio
+async def test_zstd_round_trip(api: FakeFileZen) -> None:
+    zstandard = pytest.importorskip("zstandard")
+
+    async with ZenStorage(
+        api_key="test-key",
+        transport=httpx.MockTransport(api.handler),
+        compression="zstd",
+    ) as storage:
+        upload = await storage.upload(TEXT, name="data.json", mime_type=JSON)
+
+    assert upload.content_encoding == "zstd"
+    decompressor = zstandard.ZstdDecompressor()
+    assert decompressor.decompressobj().decompress(api.uploads[0]) == TEXT
+
+
+@pytest.mark.asyncio
+async def test_incompressible_content_is_sent_as_is(
+    api: FakeFileZen, gzip_storage: ZenStorage
+) -> None:
+    data = os.urandom(32 * 1024)
+
+    upload = await gzip_storage.upload(data, name="data.json", mime_type=JSON)
+
+    assert upload.content_encoding is None
+    assert api.uploads == [data]
+
+
+@pytest.mark.asyncio
+async def test_incompressible_stream_replays_its_sample(
+    api: FakeFileZen, gzip_storage: ZenStorage
+) -> None:
+    # The sample spans several pieces, all read before the stream is judged
+    pieces = [os.urandom(24 * 1024) for _ in range(8)]
+
+    upload = await gzip_storage.upload(iter(pieces), name="data.json", mime_type=JSON)
+
+    assert upload.content_encoding is None
+    session = list(api.sessions.values())[0]
+    assert session["params"]["uploadMode"] == "streaming"
+    assert session["data"] == b"".join(pieces)
+
+
+@pytest.mark.asyncio
+async def test_compressible_stream_replays_its_sample(
+    api: FakeFileZen, gzip_storage: ZenStorage
+) -> None:
+    def pieces() -> Iterator[bytes]:
+        for i in range(0, len(TEXT), 10_000):
+            yield TEXT[i : i + 10_000]
+
+    upload = await gzip_storage.upload(pieces(), name="data.json", mime_type=JSON)
+
+    assert upload.content_encoding == "gzip"
+    session = list(api.sessions.values())[0]
+    assert gzip.decompress(session["data"]) == TEXT
+
+
+@pytest.mark.asyncio
+async def test_large_source_is_compressed_as_a_stream(
+    api: FakeFileZen, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(zen_upload, "MULTIPART_CHUNK_SIZE", CHUNK_SIZE)
+    monkeypatch.setattr(zen_upload, "MULTIPART_THRESHOLD", CHUNK_SIZE)
+    data = TEXT * 8
+    path = tmp_path / "data.json"
+    path.write_bytes(data)
+    journal = tmp_path / "journal"
+
+    async with ZenStorage(
+        api_key="test-key",
+        transport=httpx.MockTransport(api.handler),
+        compression="gzip",
+        journal=journal,
+    ) as storage:
+        upload = await storage.upload(path, resume=True)
+
+    assert upload.content_encoding == "gzip"
+    session = list(api.sessions.values())[0]
+    # A compressed stream has no size up front, so the upload cannot resume
+    assert session["params"]["uploadMode"] == "streaming"
+    assert "totalSize" not in session["params"]
+    assert json.loads(session["params"]["metadata"]) == {"contentEncoding": "gzip"}
+    assert gzip.decompress(session["data"]) == data
+    assert os.listdir(journal) == []
@@ -0,0 +1,53 @@
+"""Tests for upload deduplication."""
+
+import sqlite3
+from pathlib import Path
+
+import httpx
+import pytest
+
+from filezen import ZenDedupIndex, ZenSQLiteDedupIndex, ZenStorage
+
+from .conftest import FakeFileZen
+
+
+def test_index_interface_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        ZenDedupIndex()  # type: ignore[abstract]
+
+
+@pytest.mark.asyncio
+async def test_repeat_upload_is_deduplicated(api: FakeFileZen, tmp_path: Path) -> None:
+    storage = ZenStorage(
+        api_key="test-key",
+        transport=httpx.MockTransport(api.handler),
+        dedup=tmp_path / "dedup.db",
+    )
+    first = await storage.upload(b"same content", name="a.txt")
+    second = await storage.upload(b"same content", name="a.txt")
+    await storage.close()
+
+    assert not first.deduplicated and second.deduplicated
+    assert second.file == first.file
+    assert len(api.uploads) == 1
+
+
+@pytest.mark.asyncio
+async def test_close_closes_only_an_index_opened_from_a_path(
+    api: FakeFileZen, tmp_path: Path
+) -> None:
+    transport = httpx.MockTransport(api.handler)
+    owned = ZenStorage(api_key="test-key", transport=transport, dedup=tmp_path / "a.db")
+    index = owned.dedup.index if owned.dedup else None
+    assert isinstance(index, ZenSQLiteDedupIndex)
+
+    supplied = ZenSQLiteDedupIndex(tmp_path / "b.db")
+    shared = ZenStorage(api_key="test-key", transport=transport, dedup=supplied)
+
+    await owned.close()
+    await shared.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        await index.get("key")
+    assert await supplied.get("key") is None
+    supplied.close()
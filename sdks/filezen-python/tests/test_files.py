@@ -0,0 +1,97 @@
+"""Tests for listing files."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from filezen import ZenStorage
+
+from .conftest import FakeFileZen
+
+
+def files(count: int) -> List[Dict[str, Any]]:
+    return [{"id": f"f{i}", "name": f"file-{i}.txt"} for i in range(count)]
+
+
+async def names(storage: ZenStorage, **kwargs: Any) -> List[str]:
+    return [file.name async for file in storage.iter_files(**kwargs)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [0, 7, 50, 53])
+async def test_offset_paging(api: FakeFileZen, storage: ZenStorage, count: int) -> None:
+    api.files = files(count)
+
+    assert await names(storage, page_size=10, prefetch=3) == [
+        f"file-{i}.txt" for i in range(count)
+    ]
+    # Never past the total
+    offsets = [int(r.url.params["offset"]) for r in api.list_requests()]
+    assert offsets == list(range(0, max(count, 1), 10))
+
+
+@pytest.mark.asyncio
+async def test_offset_paging_without_total_stops_at_a_short_page(
+    api: FakeFileZen, storage: ZenStorage
+) -> None:
+    api.files = files(25)
+    api.report_total = False
+
+    assert len(await names(storage, page_size=10, prefetch=2)) == 25
+
+
+@pytest.mark.asyncio
+async def test_server_capped_page_size(api: FakeFileZen, storage: ZenStorage) -> None:
+    api.files = files(250)
+    api.max_limit = 100
+
+    assert await names(storage, page_size=500) == [f"file-{i}.txt" for i in range(250)]
+    offsets = [int(r.url.params["offset"]) for r in api.list_requests()]
+    assert offsets == [0, 100, 200]
+
+
+@pytest.mark.asyncio
+async def test_page_shorter_than_the_rest_is_continued(
+    api: FakeFileZen, storage: ZenStorage
+) -> None:
+    api.files = files(30)
+    original = api._list_files
+
+    def short_second_page(request: Any) -> Any:
+        # The page at offset 10 comes back with 4 of its 10 files
+        response = original(request)
+        if request.url.params.get("offset") == "10":
+            body = response.json()
+            body["data"] = body["data"][:4]
+            response = type(response)(200, json=body)
+        return response
+
+    api._list_files = short_second_page  # type: ignore[method-assign]
+
+    assert await names(storage, page_size=10, prefetch=3) == [
+        f"file-{i}.txt" for i in range(30)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cursor_paging(api: FakeFileZen, storage: ZenStorage) -> None:
+    api.files = files(35)
+    api.cursor_paging = True
+
+    assert await names(storage, page_size=10) == [f"file-{i}.txt" for i in range(35)]
+    cursors = [r.url.params.get("cursor") for r in api.list_requests()]
+    assert cursors == [None, "10", "20", "30"]
+
+
+@pytest.mark.asyncio
+async def test_leaving_early_cancels_pending_pages(
+    api: FakeFileZen, storage: ZenStorage
+) -> None:
+    api.files = files(1000)
+
+    iterator = storage.iter_files(page_size=10, prefetch=4)
+    async for _ in iterator:
+        break
+    await iterator.aclose()  # type: ignore[attr-defined]
+
+    assert len(api.list_requests()) <= 5
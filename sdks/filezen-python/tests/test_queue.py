@@ -0,0 +1,103 @@
+"""Tests for UploadQueue."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from filezen import ZenStorage, ZenUpload, ZenUploadPriority
+from filezen.zen_queue import UploadQueue
+
+HIGH = ZenUploadPriority.HIGH
+NORMAL = ZenUploadPriority.NORMAL
+LOW = ZenUploadPriority.LOW
+
+
+class Runner:
+    """Runs uploads by recording their start and waiting for ``release``."""
+
+    def __init__(self) -> None:
+        self.started: List[str] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, upload: ZenUpload) -> ZenUpload:
+        self.started.append(upload.name)
+        await self.release.wait()
+        return upload
+
+
+def build(storage: ZenStorage, name: str) -> ZenUpload:
+    return storage.build_upload(b"data", {"name": name})
+
+
+@pytest.mark.asyncio
+async def test_higher_priorities_start_first(storage: ZenStorage) -> None:
+    runner = Runner()
+    queue = UploadQueue(runner, workers=1)
+
+    futures = [queue.put(build(storage, "busy"), LOW)]
+    for name, priority in [
+        ("low", LOW),
+        ("normal", NORMAL),
+        ("high-1", HIGH),
+        ("high-2", HIGH),
+    ]:
+        futures.append(queue.put(build(storage, name), priority))
+    assert queue.pending == 4
+
+    runner.release.set()
+    await asyncio.gather(*futures)
+
+    assert runner.started == ["busy", "high-1", "high-2", "normal", "low"]
+
+
+@pytest.mark.asyncio
+async def test_class_limit_does_not_hold_up_other_classes(
+    storage: ZenStorage,
+) -> None:
+    runner = Runner()
+    queue = UploadQueue(runner, workers=4, class_limits={LOW: 1})
+
+    futures = [queue.put(build(storage, f"low-{i}"), LOW) for i in range(3)]
+    futures.append(queue.put(build(storage, "normal"), NORMAL))
+    await asyncio.sleep(0)
+
+    assert runner.started == ["low-0", "normal"]
+    assert (queue.running, queue.pending) == (2, 2)
+
+    runner.release.set()
+    await asyncio.gather(*futures)
+    assert runner.started == ["low-0", "normal", "low-1", "low-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_upload_never_starts(storage: ZenStorage) -> None:
+    runner = Runner()
+    queue = UploadQueue(runner, workers=1)
+
+    busy = queue.put(build(storage, "busy"), NORMAL)
+    cancelled = queue.put(build(storage, "cancelled"), NORMAL)
+    after = queue.put(build(storage, "after"), NORMAL)
+    cancelled.cancel()
+
+    runner.release.set()
+    await asyncio.gather(busy, after)
+
+    assert runner.started == ["busy", "after"]
+    assert (queue.running, queue.pending) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_and_running(storage: ZenStorage) -> None:
+    runner = Runner()
+    queue = UploadQueue(runner, workers=1)
+
+    futures = [queue.put(build(storage, f"upload-{i}"), NORMAL) for i in range(4)]
+    await asyncio.sleep(0)
+    assert (queue.running, queue.pending) == (1, 3)
+
+    await queue.close()
+
+    assert (queue.running, queue.pending) == (0, 0)
+    assert all(future.cancelled() for future in futures)
+    assert runner.started == ["upload-0"]
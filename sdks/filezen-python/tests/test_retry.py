@@ -0,0 +1,122 @@
+"""Tests for retrying transient API failures."""
+
+import asyncio
+from typing import AsyncIterator, List
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from filezen import ZenError, ZenRetryPolicy, ZenStorage
+from filezen.zen_api import ZenApi
+
+from .conftest import FakeFileZen
+
+
+@pytest.fixture
+def delays(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Record the waits between attempts instead of sleeping through them."""
+    recorded: List[float] = []
+    sleep = asyncio.sleep
+
+    async def record(delay: float) -> None:
+        # The fake API yields with sleep(0); backoff never waits zero seconds
+        if delay:
+            recorded.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", record)
+    return recorded
+
+
+@pytest_asyncio.fixture
+async def zen_api(api: FakeFileZen) -> AsyncIterator[ZenApi]:
+    storage = ZenStorage(
+        api_key="test-key",
+        transport=httpx.MockTransport(api.handler),
+        retry=ZenRetryPolicy(initial_delay=0.5, jitter=0.0),
+    )
+    yield storage.api
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_chunk_is_resent_intact_after_503(
+    api: FakeFileZen, zen_api: ZenApi, delays: List[float]
+) -> None:
+    chunk = bytes(range(256)) * 64
+    session = await zen_api.initialize_multipart_upload(
+        {
+            "fileName": "data.bin",
+            "mimeType": "application/octet-stream",
+            "totalSize": len(chunk),
+            "chunkSize": len(chunk),
+        }
+    )
+    api.failures.append(httpx.Response(503))
+
+    await zen_api.upload_chunk(session.id, chunk, 0, len(chunk))
+
+    parts = [r for r in api.requests if r.url.path == "/files/chunk-upload/part"]
+    assert [api._payload(r) for r in parts] == [chunk, chunk]
+    assert api.sessions[session.id]["chunks"][0] == chunk
+    assert delays == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_overrides_backoff(
+    api: FakeFileZen, zen_api: ZenApi, delays: List[float]
+) -> None:
+    api.failures.append(httpx.Response(429, headers={"Retry-After": "3"}))
+
+    await zen_api.list_files(limit=10)
+
+    assert delays == [3.0]
+    assert len(api.list_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_past_max_elapsed(
+    api: FakeFileZen, zen_api: ZenApi, delays: List[float]
+) -> None:
+    zen_api.retry.max_elapsed = 10.0
+    api.failures.extend(
+        [httpx.Response(503), httpx.Response(503, headers={"Retry-After": "60"})]
+    )
+
+    with pytest.raises(ZenError) as info:
+        await zen_api.list_files(limit=10)
+
+    assert info.value.code == "503"
+    assert info.value.details["retries"] == 1
+    assert delays == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_on_500(
+    api: FakeFileZen, zen_api: ZenApi, delays: List[float]
+) -> None:
+    api.failures.append(httpx.Response(500))
+
+    with pytest.raises(ZenError) as info:
+        await zen_api.initialize_multipart_upload(
+            {"fileName": "data.bin", "mimeType": "application/octet-stream"}
+        )
+
+    assert info.value.details["retries"] == 0
+    assert len(api.requests) == 1
+    assert delays == []
+
+
+@pytest.mark.asyncio
+async def test_final_error_counts_retries(
+    api: FakeFileZen, zen_api: ZenApi, delays: List[float]
+) -> None:
+    api.failures.extend(httpx.Response(502) for _ in range(5))
+
+    with pytest.raises(ZenError) as info:
+        await zen_api.list_files(limit=10)
+
+    assert info.value.details["retries"] == 4
+    assert len(api.list_requests()) == 5
+    assert delays == [0.5, 1.0, 2.0, 4.0]
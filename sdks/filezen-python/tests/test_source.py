@@ -0,0 +1,155 @@
+"""Tests for upload source classification."""
+
+import base64
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from filezen import (
+    ZenBase64Source,
+    ZenBytesSource,
+    ZenPathSource,
+    ZenStorage,
+    ZenStreamSource,
+    ZenTextSource,
+    ZenUrlSource,
+    zen_storage,
+    zen_upload,
+)
+from filezen.utils import is_base64, is_url
+from filezen.zen_source import (
+    Base64Reader,
+    aiter_items,
+    content_digest,
+    resolve_source,
+    source_identity,
+)
+
+from .conftest import FakeFileZen
+
+DATA = b"typed source content"
+
+
+@pytest.fixture
+def mapped(tmp_path: Path) -> Iterator[mmap.mmap]:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"mapped content")
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        yield m
+
+
+def test_mmap_is_a_buffer(mapped: mmap.mmap) -> None:
+    assert resolve_source(mapped) == ("buffer", mapped)
+
+
+@pytest.mark.asyncio
+async def test_mmap_is_hashed_as_a_buffer(mapped: mmap.mmap) -> None:
+    digest = f"sha256:{hashlib.sha256(b'mapped content').hexdigest()}"
+    assert await content_digest(mapped) == digest
+    assert await source_identity(mapped) == digest
+
+
+@pytest.mark.asyncio
+async def test_aiter_items_passes_none_items_through() -> None:
+    items = [item async for item in aiter_items(iter([1, None, 2]))]
+    assert items == [1, None, 2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "wrap, kind",
+    [
+        (lambda path: ZenUrlSource("https://origin.test/data.bin"), "url"),
+        (lambda path: ZenBase64Source(base64.b64encode(DATA).decode()), "base64"),
+        (lambda path: ZenTextSource(DATA.decode()), "text"),
+        (lambda path: ZenBytesSource(DATA), "buffer"),
+        (lambda path: ZenPathSource(str(path)), "file"),
+        (lambda path: ZenStreamSource(iter([DATA[:5], DATA[5:]])), "stream"),
+    ],
+)
+async def test_typed_source_is_uploaded_as_its_kind(
+    api: FakeFileZen,
+    storage: ZenStorage,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    wrap: Any,
+    kind: str,
+) -> None:
+    api.origin = DATA
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    resolved = []
+
+    def counting_resolve(source: Any) -> Any:
+        resolved.append(source)
+        return resolve_source(source)
+
+    monkeypatch.setattr(zen_storage, "resolve_source", counting_resolve)
+    monkeypatch.setattr(zen_upload, "resolve_source", counting_resolve)
+
+    upload = storage.build_upload(wrap(path), {"name": "data.bin"})
+    await upload.upload()
+
+    assert len(resolved) == 1
+    assert upload.source_kind == kind
+    assert upload.is_completed
+    sessions = list(api.sessions.values())
+    assert (sessions[0]["data"] if sessions else api.uploads[0]) == DATA
+
+
+def test_url_sniffing_reads_only_the_start() -> None:
+    assert is_url("https://origin.test/" + "a" * 10_000_000)
+    assert not is_url("a" * 10_000_000 + "https://origin.test/")
+
+
+def test_base64_sniffing_samples_the_ends() -> None:
+    group = base64.b64encode(b"abc").decode()
+    ends = group * 10_000
+    assert is_base64(ends + group + ends)
+    # Only a sample at each end is checked, so the middle is never scanned
+    assert is_base64(ends + "!!!!" + ends)
+    assert not is_base64("!!!!" + ends + ends)
+    assert not is_base64(ends + ends + "!!!!")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [300, 301, 302])
+@pytest.mark.parametrize("prefix", ["", "data:image/png;base64,"])
+async def test_base64_reader_decodes_ranges(size: int, prefix: str) -> None:
+    encoded = base64.b64encode(os.urandom(size)).decode()
+    decoded = base64.b64decode(encoded)
+    reader = Base64Reader(prefix + encoded)
+
+    assert reader.size == size
+    assert reader.mime_type == ("image/png" if prefix else None)
+    # Chunk sizes that start and end ranges at every offset within a group
+    for chunk_size in (1, 2, 4, 5, 7, 64, size):
+        for start in range(0, size, chunk_size):
+            end = min(start + chunk_size, size)
+            assert bytes(await reader.read(start, end)) == decoded[start:end]
+
+
+@pytest.mark.asyncio
+async def test_base64_reader_decodes_large_ranges_off_the_loop() -> None:
+    encoded = base64.b64encode(os.urandom(200_001)).decode()
+    decoded = base64.b64decode(encoded)
+    reader = Base64Reader(encoded)
+
+    for start in range(0, reader.size, 70_001):
+        end = min(start + 70_001, reader.size)
+        assert bytes(await reader.read(start, end)) == decoded[start:end]
+
+
+@pytest.mark.asyncio
+async def test_base64_reader_rejects_invalid_characters() -> None:
+    encoded = base64.b64encode(os.urandom(300)).decode()
+    # Characters 200-203 decode to bytes 150-152
+    reader = Base64Reader(encoded[:201] + "!" + encoded[202:])
+
+    assert bytes(await reader.read(0, 150)) == base64.b64decode(encoded)[:150]
+    with pytest.raises(ValueError, match="Invalid base64"):
+        await reader.read(140, 160)
@@ -0,0 +1,90 @@
+"""Tests for the synchronous storage client."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import pytest
+
+from filezen import ZenSyncStorage
+
+from .conftest import FakeFileZen
+
+
+@pytest.fixture
+def sync_storage(api: FakeFileZen) -> Iterator[ZenSyncStorage]:
+    storage = ZenSyncStorage(api_key="test-key")
+    # The client takes no transport, so point its HTTP clients at the fake API
+    zen_api = storage.storage.api
+    transport = httpx.MockTransport(api.handler)
+    zen_api.client = httpx.AsyncClient(
+        base_url=zen_api.client.base_url,
+        headers=zen_api.client.headers,
+        transport=transport,
+    )
+    zen_api.source_client = httpx.AsyncClient(transport=transport)
+    yield storage
+    storage.close()
+
+
+def test_upload_path(
+    api: FakeFileZen, sync_storage: ZenSyncStorage, tmp_path: Path
+) -> None:
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"%PDF report")
+
+    upload = sync_storage.upload(path)
+
+    assert upload.file is not None
+    assert upload.name == "report.pdf"
+    assert api.uploads == [b"%PDF report"]
+
+
+def test_iter_files_bridges_pages(
+    api: FakeFileZen, sync_storage: ZenSyncStorage
+) -> None:
+    api.files = [api._file(f"file-{i}", i) for i in range(250)]
+
+    names = [file.name for file in sync_storage.iter_files(page_size=100)]
+
+    assert names == [f"file-{i}" for i in range(250)]
+    assert [r.url.params["offset"] for r in api.list_requests()] == [
+        "0",
+        "100",
+        "200",
+    ]
+
+
+def test_iter_files_stops_early(api: FakeFileZen, sync_storage: ZenSyncStorage) -> None:
+    api.files = [api._file(f"file-{i}", i) for i in range(250)]
+
+    for file in sync_storage.iter_files(page_size=100):
+        if file.name == "file-5":
+            break
+
+    # The generator was closed on the loop, which keeps serving calls
+    assert sync_storage.list_files(limit=10).data[0].name == "file-0"
+
+
+def test_calls_from_many_threads(
+    api: FakeFileZen, sync_storage: ZenSyncStorage
+) -> None:
+    payloads = [f"payload {i}".encode() for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        uploads = list(
+            executor.map(
+                lambda data: sync_storage.upload(data, name="data.bin"), payloads
+            )
+        )
+
+    assert all(upload.file is not None for upload in uploads)
+    assert sorted(api.uploads) == sorted(payloads)
+
+
+def test_closed_client_refuses_calls(sync_storage: ZenSyncStorage) -> None:
+    sync_storage.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        sync_storage.list_files()
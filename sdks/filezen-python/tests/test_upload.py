@@ -0,0 +1,184 @@
+"""Tests for ZenUpload."""
+
+import asyncio
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import pytest
+
+from filezen import ZenError, ZenStorage, ZenTextSource, zen_upload
+
+from .conftest import FakeFileZen
+
+CHUNK_SIZE = 64 * 1024
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(zen_upload, "MULTIPART_CHUNK_SIZE", CHUNK_SIZE)
+    monkeypatch.setattr(zen_upload, "MULTIPART_THRESHOLD", CHUNK_SIZE)
+
+
+@pytest.mark.asyncio
+async def test_stale_next_chunk_index_is_not_resent(
+    api: FakeFileZen, storage: ZenStorage
+) -> None:
+    # Chunk 0's response asks for chunk 1, but only arrives once chunk 1 was
+    # acknowledged, while the last chunk is still in flight
+    api.chunk_delays = {0: 0.02, 9: 0.1}
+    data = os.urandom(10 * CHUNK_SIZE)
+
+    upload = await storage.upload(data, name="data.bin", multipart_concurrency=4)
+
+    assert upload.is_completed
+    assert sorted(api.chunk_indexes()) == list(range(10))
+    assert list(api.sessions.values())[0]["data"] == data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [CHUNK_SIZE // 2, 3 * CHUNK_SIZE + 1])
+async def test_mmap_source(
+    api: FakeFileZen, storage: ZenStorage, tmp_path: Path, size: int
+) -> None:
+    data = os.urandom(size)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        upload = await storage.upload(m, name="data.bin")
+
+    assert upload.is_completed
+    if size <= CHUNK_SIZE:
+        assert api.uploads == [data]
+    else:
+        assert list(api.sessions.values())[0]["data"] == data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("multipart_concurrency", [1, 4])
+async def test_url_source_is_fetched_without_api_key(
+    api: FakeFileZen, storage: ZenStorage, multipart_concurrency: int
+) -> None:
+    api.origin = os.urandom(3 * CHUNK_SIZE)
+
+    upload = await storage.upload(
+        "https://origin.test/data.bin",
+        name="data.bin",
+        multipart_concurrency=multipart_concurrency,
+    )
+
+    assert upload.is_completed
+    assert list(api.sessions.values())[0]["data"] == api.origin
+    assert api.origin_requests
+    assert all("apikey" not in r.headers for r in api.origin_requests)
+    assert all(r.headers["apikey"] == "test-key" for r in api.requests)
+
+
+@pytest.mark.asyncio
+async def test_ranged_url_source_is_fetched_by_range(
+    api: FakeFileZen, storage: ZenStorage
+) -> None:
+    api.origin = os.urandom(3 * CHUNK_SIZE + 1)
+
+    upload = await storage.upload("https://origin.test/data.bin", name="data.bin")
+
+    assert upload.is_completed
+    session = list(api.sessions.values())[0]
+    assert session["params"]["totalSize"] == str(len(api.origin))
+    assert session["data"] == api.origin
+    assert api.origin_requests[0].method == "HEAD"
+    assert {r.headers["range"] for r in api.origin_requests[1:]} == {
+        f"bytes={i * CHUNK_SIZE}-{min((i + 1) * CHUNK_SIZE, len(api.origin)) - 1}"
+        for i in range(4)
+    }
+
+
+@pytest.mark.asyncio
+async def test_unranged_url_source_is_streamed(
+    api: FakeFileZen, storage: ZenStorage
+) -> None:
+    api.origin = os.urandom(3 * CHUNK_SIZE + 1)
+    api.origin_ranges = False
+
+    upload = await storage.upload(
+        "https://origin.test/data.bin", name="data.bin", multipart_concurrency=4
+    )
+
+    assert upload.is_completed
+    session = list(api.sessions.values())[0]
+    assert session["params"]["uploadMode"] == "streaming"
+    assert session["data"] == api.origin
+    assert [r.method for r in api.origin_requests] == ["HEAD", "GET"]
+    assert "range" not in api.origin_requests[1].headers
+
+
+@pytest.mark.parametrize("text", ["plain text", "naïve café ☕ 🚀"])
+def test_inflight_bytes_counts_text_as_utf8(storage: ZenStorage, text: str) -> None:
+    upload = storage.build_upload(ZenTextSource(text), {"name": "note.txt"})
+
+    assert upload.inflight_bytes() == len(text.encode("utf-8"))
+
+
+def test_inflight_bytes_counts_chunks_read_ahead(storage: ZenStorage) -> None:
+    upload = storage.build_upload(
+        bytes(20 * CHUNK_SIZE), {"name": "data.bin", "multipart_concurrency": 4}
+    )
+    # Four chunks being sent, and up to four read and hashed ahead
+    assert upload.inflight_bytes() == 8 * CHUNK_SIZE
+
+
+@pytest.mark.asyncio
+async def test_resume_sends_only_missing_chunks(
+    api: FakeFileZen, tmp_path: Path
+) -> None:
+    data = os.urandom(6 * CHUNK_SIZE)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    api.chunk_failures = {3: 400}
+
+    async with ZenStorage(
+        api_key="test-key",
+        transport=httpx.MockTransport(api.handler),
+        journal=tmp_path / "journal",
+    ) as storage:
+        with pytest.raises(ZenError):
+            await storage.upload(path)
+        assert api.chunk_indexes() == [0, 1, 2, 3]
+
+        upload = await storage.upload(path, resume=True)
+
+    assert upload.is_completed
+    assert api.chunk_indexes()[4:] == [3, 4, 5]
+    assert len(api.sessions) == 1
+    assert list(api.sessions.values())[0]["data"] == data
+    assert os.listdir(tmp_path / "journal") == []
+
+
+@pytest.mark.asyncio
+async def test_failed_streaming_upload_cancels_queued_checksums(
+    api: FakeFileZen, storage: ZenStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hashed = []
+
+    async def slow_checksum(self: zen_upload.ZenUpload, chunk: bytes) -> str:
+        # The first chunk is hashed, and its send fails, once later chunks
+        # are queued with their checksums still running
+        hashed.append(chunk)
+        await asyncio.sleep(0.05 if len(hashed) == 1 else 10)
+        return "sha256:00"
+
+    monkeypatch.setattr(zen_upload.ZenUpload, "_chunk_checksum", slow_checksum)
+    api.chunk_failures = {0: 400}
+
+    def generate() -> Iterator[bytes]:
+        for _ in range(8):
+            yield os.urandom(CHUNK_SIZE)
+
+    with pytest.raises(ZenError):
+        await storage.upload(generate(), name="data.bin", multipart_concurrency=2)
+
+    assert len(hashed) > 2
+    assert asyncio.all_tasks() == {asyncio.current_task()}